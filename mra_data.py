@@ -15,16 +15,50 @@ class RelationSchema:
     Attributes are stored internally as a sorted tuple to ensure that schemas
     are immutable and that their order does not affect equality.
     (e.g., RelationSchema(['a', 'b']) == RelationSchema(['b', 'a']))
+
+    Schemas are interned: constructing a schema with the same attributes, in
+    any order, returns the same shared instance, whose hash is computed once.
+    This keeps schema construction and lookups cheap in operator loops.
     """
     attributes: Tuple[str, ...]
 
-    def __init__(self, attributes: List[str]):
+    def __new__(cls, attributes: List[str] = ()):
+        sorted_attributes = tuple(sorted(attributes))
+        schema = _SCHEMA_CACHE.get(sorted_attributes)
+        if schema is None:
+            schema = super().__new__(cls)
+            # We use object.__setattr__ because the dataclass is frozen.
+            object.__setattr__(schema, 'attributes', sorted_attributes)
+            object.__setattr__(schema, '_hash', hash(sorted_attributes))
+            _SCHEMA_CACHE[sorted_attributes] = schema
+        return schema
+
+    def __init__(self, attributes: List[str] = ()):
         """
         Initializes the schema from a list of strings for convenience.
-        The attributes are sorted and converted to a tuple internally.
+        The attributes are sorted and converted to a tuple internally, once
+        per distinct schema, when the interned instance is created.
         """
-        # We use object.__setattr__ because the dataclass is frozen.
-        object.__setattr__(self, 'attributes', tuple(sorted(attributes)))
+
+    def __hash__(self):
+        return self._hash
+
+    def __reduce__(self):
+        # Rebuild through the constructor so unpickled schemas are interned.
+        return (RelationSchema, (self.attributes,))
+
+
+# Interned schemas, keyed by their sorted attributes, so there is one entry
+# per distinct schema however many attribute orders it is built from.
+_SCHEMA_CACHE: Dict[Tuple[str, ...], RelationSchema] = {}
+
+
+def _table_to_string(df: pd.DataFrame, max_rows: int) -> str:
+    """Renders at most `max_rows` rows of a DataFrame, noting any omitted."""
+    rendered = df.head(max_rows).to_string(index=False)
+    if len(df) > max_rows:
+        rendered += f"\n... [{len(df) - max_rows} more rows]"
+    return rendered
 
 
 class RelationSpace:
@@ -32,6 +66,9 @@ class RelationSpace:
     Represents a RelationSpace, a collection of relations (DataFrames)
     indexed by their dimensional schema.
     """
+    # Maximum number of rows of each relation rendered by __repr__.
+    MAX_ROWS_REPR = 20
+
     def __init__(self, dimensions: RelationSchema):
         self.dimensions = dimensions
         self._relations: Dict[RelationSchema, pd.DataFrame] = {}
@@ -78,7 +115,7 @@ class RelationSpace:
             return rep + "Empty RelationSpace"
         for dims_schema, df in self._relations.items():
             rep += f"--> Relation with Dimensions: {dims_schema.attributes}\n"
-            rep += df.to_string(index=False) + "\n\n"
+            rep += _table_to_string(df, self.MAX_ROWS_REPR) + "\n\n"
         return rep
 
 
@@ -99,10 +136,22 @@ def create_relation_tuple(key_values: Dict[str, Any]) -> RelationTuple:
     Returns:
         A new RelationTuple instance.
     """
+    if not key_values:
+        return EMPTY_REGION_TUPLE
     sorted_items = tuple(sorted(key_values.items()))
     return RelationTuple(sorted_items)
 
 
+# The region of the reference slice tuple, which holds the unsliced data.
+EMPTY_REGION_TUPLE = RelationTuple(())
+# The schema of a relation with no dimensions, e.g. the cube's grand total.
+EMPTY_SCHEMA = RelationSchema([])
+
+
+# Column added by SliceRelation.feature_table to identify each row's region.
+REGION_ID_COLUMN = '_region_id'
+
+
 class SliceRelation:
     """
     Represents a SliceRelation, which structures data around entities (regions)
@@ -112,6 +161,9 @@ class SliceRelation:
     - The outer dictionary maps a RelationTuple to its feature tables.
     - The inner dictionary maps a RelationSchema to a specific feature DataFrame.
     """
+    # Maximum number of rows of each feature table rendered by __repr__.
+    MAX_ROWS_REPR = 20
+
     def __init__(self, dimensions: RelationSchema):
         """
         Initializes the SliceRelation.
@@ -124,11 +176,73 @@ class SliceRelation:
         self.data: Dict[RelationTuple, Dict[RelationSchema, pd.DataFrame]] = {}
 
     def add_slice_tuple(self, region: RelationTuple, feature_schema: RelationSchema, feature_data: pd.DataFrame):
-        """Adds or updates a feature table for a specific region."""
+        """
+        Adds or updates a feature table for a specific region.
+
+        The table is stored as given, not copied, so operators can pass
+        tables through to a new SliceRelation. Feature tables are shared
+        between relations and must be treated as read-only, including by
+        slice transformations.
+        """
         if region not in self.data:
             self.data[region] = {}
         self.data[region][feature_schema] = feature_data
 
+    def add_slice_tuples(self, region: RelationTuple, features: Dict[RelationSchema, pd.DataFrame]):
+        """
+        Adds or updates several feature tables of a region at once, with the
+        same sharing rules as add_slice_tuple.
+        """
+        if not features:
+            return
+        if region not in self.data:
+            self.data[region] = dict(features)
+        else:
+            self.data[region].update(features)
+
+    def feature_table(self, feature_schema: RelationSchema) -> pd.DataFrame:
+        """
+        Stacks the feature tables of every region for one feature schema.
+
+        This is a column-oriented view of the SliceRelation: a single
+        DataFrame per feature schema instead of one small DataFrame per
+        region, so per-region logic can run as vectorized operations
+        grouped on the region id.
+
+        Args:
+            feature_schema: The feature schema whose tables are stacked.
+
+        Returns:
+            A DataFrame with a REGION_ID_COLUMN holding the position of each
+            row's region in `data`, followed by the feature columns.
+        """
+        region_ids = []
+        tables = []
+        for region_id, features in enumerate(self.data.values()):
+            feature_df = features.get(feature_schema)
+            if feature_df is not None:
+                region_ids.append(np.full(len(feature_df), region_id))
+                tables.append(feature_df)
+
+        if not tables:
+            return pd.DataFrame(
+                columns=[REGION_ID_COLUMN, *feature_schema.attributes])
+
+        columns = {REGION_ID_COLUMN: np.concatenate(region_ids)}
+        for col in feature_schema.attributes:
+            arrays = [df[col].array for df in tables]
+            if all(isinstance(values, pd.arrays.NumpyExtensionArray)
+                   for values in arrays) and len(
+                       {values.dtype for values in arrays}) == 1:
+                columns[col] = np.concatenate(
+                    [values.to_numpy() for values in arrays])
+            else:
+                # Extension dtypes (nullable, categorical, ...) and mixed
+                # dtypes are combined as pandas would, keeping their dtype.
+                columns[col] = pd.concat(
+                    [df[col] for df in tables], ignore_index=True).array
+        return pd.DataFrame(columns)
+
     def __repr__(self):
         """Provides a string representation of the SliceRelation."""
         rep = f"SliceRelation(Dimensions: {self.dimensions.attributes})\n"
@@ -142,6 +256,7 @@ class SliceRelation:
             rep += f"Region: ({region_str})\n"
             for f_schema, df in features.items():
                 rep += f"  Feature Schema: {f_schema.attributes}\n"
-                rep += "  " + df.to_string(index=False).replace('\n', '\n  ') + "\n"
+                rep += "  " + _table_to_string(
+                    df, self.MAX_ROWS_REPR).replace('\n', '\n  ') + "\n"
             rep += "\n"
         return rep
@@ -21,7 +21,7 @@ def main():
     base_data = {
         'Device': ['Pixel', 'Pixel', 'iPhone', 'iPhone', 'Surface', 'Pixel'],
         'Browser': ['Chrome', 'Chrome', 'Safari', 'Safari', 'Edge', 'Edge'],
-        'Date': pd.to_datetime(['2025-01-01', '2025-01-02', '2025-01-01', '2025-01-02', '2025-01-01', '2025-01-01']),
+        'Date': pd.to_datetime(['2025-01-01', '2025-01-02', '2025-01-01', '2025-01-02', '2025-01-01', '2025-01-01'], format='%Y-%m-%d'),
         'Cost': [100, 200, 150, 50, 1200, 80],
         'Clicks': [20, 5, 30, 10, 60, 10]
     }
@@ -31,17 +31,20 @@ def main():
     print("\n" + "="*60 + "\n")
 
     # 4. Create several aggregated relations from the base data.
-    
+    # The base data is scanned once, at the finest grouping; the coarser
+    # relations are rolled up from that (much smaller) result.
+    cost_by_device_browser_series = base_relation.groupby(['Device', 'Browser'])['Cost'].sum()
+
     # Relation 1: Aggregated by 'Device'
-    cost_by_device = base_relation.groupby('Device')['Cost'].sum().reset_index()
+    cost_by_device = cost_by_device_browser_series.groupby(level='Device').sum().reset_index()
     device_schema = RelationSchema(['Device'])
 
     # Relation 2: Aggregated by 'Browser'
-    cost_by_browser = base_relation.groupby('Browser')['Cost'].sum().reset_index()
+    cost_by_browser = cost_by_device_browser_series.groupby(level='Browser').sum().reset_index()
     browser_schema = RelationSchema(['Browser'])
 
     # Relation 3: Aggregated by 'Device' and 'Browser'
-    cost_by_device_browser = base_relation.groupby(['Device', 'Browser'])['Cost'].sum().reset_index()
+    cost_by_device_browser = cost_by_device_browser_series.reset_index()
     device_browser_schema = RelationSchema(['Device', 'Browser'])
 
     # 5. Add these relations to the RelationSpace.
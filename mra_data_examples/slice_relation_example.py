@@ -26,14 +26,14 @@ def main():
     
     # Feature data for the 'Pixel' region
     pixel_daily_cpc = pd.DataFrame({
-        'Date': pd.to_datetime(['2025-01-01', '2025-01-02']),
+        'Date': pd.to_datetime(['2025-01-01', '2025-01-02'], format='%Y-%m-%d'),
         'Cpc': [5.0, 40.0]
     })
     pixel_total_cost = pd.DataFrame({'TotalCost': [300]})
 
     # Feature data for the 'iPhone' region
     iphone_daily_cpc = pd.DataFrame({
-        'Date': pd.to_datetime(['2025-01-01', '2025-01-02']),
+        'Date': pd.to_datetime(['2025-01-01', '2025-01-02'], format='%Y-%m-%d'),
         'Cpc': [5.0, 5.0]
     })
     iphone_total_cost = pd.DataFrame({'TotalCost': [200]})
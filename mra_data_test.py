@@ -1,8 +1,40 @@
+import pickle
 import unittest
+from itertools import permutations
 import pandas as pd
 
 # Import the classes to be tested from your data module
-from mra_data import RelationSpace, RelationSchema
+from mra_data import (RelationSpace, RelationSchema, SliceRelation,
+                      create_relation_tuple, REGION_ID_COLUMN, _SCHEMA_CACHE)
+
+class RelationSchemaTest(unittest.TestCase):
+    """
+    Test suite for RelationSchema interning.
+    """
+
+    def test_equal_schemas_are_shared(self):
+        """
+        Tests that schemas with the same attributes, in any order, are the
+        same instance and survive pickling as that instance.
+        """
+        schema = RelationSchema(['Device', 'Browser'])
+
+        self.assertIs(schema, RelationSchema(['Browser', 'Device']))
+        self.assertEqual(schema.attributes, ('Browser', 'Device'))
+        self.assertIs(pickle.loads(pickle.dumps(schema)), schema)
+        self.assertNotEqual(schema, RelationSchema(['Device']))
+
+    def test_one_cache_entry_per_schema(self):
+        """
+        Tests that building a schema from many attribute orders adds a
+        single entry to the intern cache.
+        """
+        attributes = ['Country', 'Device', 'Browser']
+        size = len(_SCHEMA_CACHE)
+        for order in permutations(attributes):
+            RelationSchema(list(order))
+        self.assertLessEqual(len(_SCHEMA_CACHE), size + 1)
+
 
 class RelationSpaceTest(unittest.TestCase):
     """
@@ -54,5 +86,75 @@ class RelationSpaceTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.relation_space.add_relation(invalid_relation, dimensional_schema)
 
+    def test_repr_is_truncated(self):
+        """
+        Tests that the string representation renders at most MAX_ROWS_REPR
+        rows of each relation.
+        """
+        n = RelationSpace.MAX_ROWS_REPR + 5
+        relation = pd.DataFrame({'Device': [f'd{i}' for i in range(n)],
+                                 'Cost': range(n)})
+        self.relation_space.add_relation(relation, RelationSchema(['Device']))
+
+        rep = repr(self.relation_space)
+
+        self.assertIn('d19', rep)
+        self.assertNotIn('d20', rep)
+        self.assertIn('... [5 more rows]', rep)
+
+
+class SliceRelationTest(unittest.TestCase):
+    """
+    Test suite for the column-oriented view of a SliceRelation.
+    """
+
+    def test_feature_table_stacks_regions(self):
+        """
+        Tests that feature_table stacks the tables of all regions that have
+        the requested feature schema, tagging rows with their region id.
+        """
+        slice_relation = SliceRelation(
+            dimensions=RelationSchema(['Device', 'Browser']))
+        cost_schema = RelationSchema(['Cost'])
+        clicks_schema = RelationSchema(['Clicks'])
+
+        slice_relation.add_slice_tuple(
+            create_relation_tuple({'Device': 'Pixel'}), cost_schema,
+            pd.DataFrame({'Cost': [100, 200]}))
+        slice_relation.add_slice_tuple(
+            create_relation_tuple({'Device': 'iPhone'}), clicks_schema,
+            pd.DataFrame({'Clicks': [5]}))
+        slice_relation.add_slice_tuple(
+            create_relation_tuple({'Browser': 'Chrome'}), cost_schema,
+            pd.DataFrame({'Cost': [300]}))
+
+        table = slice_relation.feature_table(cost_schema)
+
+        self.assertEqual(table[REGION_ID_COLUMN].tolist(), [0, 0, 2])
+        self.assertEqual(table['Cost'].tolist(), [100, 200, 300])
+        self.assertTrue(
+            slice_relation.feature_table(RelationSchema(['Revenue'])).empty)
+
+    def test_add_slice_tuples_does_not_alias_features(self):
+        """
+        Tests that adding a region's feature tables at once keeps them in a
+        dictionary of the relation's own, while sharing the tables.
+        """
+        pixel = create_relation_tuple({'Device': 'Pixel'})
+        cost_df = pd.DataFrame({'Cost': [100]})
+        features = {RelationSchema(['Cost']): cost_df}
+
+        slice_relation = SliceRelation(dimensions=RelationSchema(['Device']))
+        slice_relation.add_slice_tuples(pixel, features)
+        slice_relation.add_slice_tuple(
+            pixel, RelationSchema(['Clicks']), pd.DataFrame({'Clicks': [5]}))
+        slice_relation.add_slice_tuples(
+            create_relation_tuple({'Device': 'iPhone'}), {})
+
+        self.assertEqual(len(features), 1)
+        self.assertIs(slice_relation.data[pixel][RelationSchema(['Cost'])],
+                      cost_df)
+        self.assertEqual(list(slice_relation.data), [pixel])
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,11 +1,22 @@
+import hashlib
+import logging
+import os
+import threading
+import numpy as np
 import pandas as pd
+from pandas.api.typing import DataFrameGroupBy
 from abc import ABC, abstractmethod
-from typing import Union, List, Callable, Dict, Any, Tuple, Set
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import reduce
+from typing import (Union, List, Callable, Dict, Any, Tuple, Set,
+                    Iterable, Mapping)
 from itertools import chain, combinations
 
 # Assuming you have a module named 'mra_data' with these classes defined.
 from mra_data import (RelationSpace, SliceRelation, RelationSchema,
-                      create_relation_tuple, RelationTuple)
+                      RelationTuple, REGION_ID_COLUMN,
+                      EMPTY_REGION_TUPLE, EMPTY_SCHEMA)
 from slice_transformations.slice_transformation import SliceTransformation
 
 # ==============================================================================
@@ -17,243 +28,921 @@ MraData = Union[pd.DataFrame, RelationSpace, SliceRelation]
 # Operator Base Class and Pipeline
 # ==============================================================================
 
+# Operators log their progress at DEBUG level; enable it with e.g.
+# logging.basicConfig(level=logging.DEBUG).
+logger = logging.getLogger(__name__)
+
 class MraOperator(ABC):
     @abstractmethod
     def _execute(self, data: MraData) -> MraData:
         pass
 
     def __call__(self, data: MraData) -> MraData:
-        print(f"Executing {self.__class__.__name__}...")
+        logger.debug("Executing %s", self.__class__.__name__)
         return self._execute(data)
 
     def __or__(self, other: 'MraOperator') -> 'Pipeline':
         if isinstance(other, Pipeline):
-            return Pipeline([self] + other.operators)
-        return Pipeline([self, other])
+            return Pipeline((self,) + other.operators, fuse=other.fuse)
+        return Pipeline((self, other))
 
 class Pipeline(MraOperator):
-    def __init__(self, operators: list[MraOperator]):
-        self.operators = operators
+    """
+    Runs a sequence of operators, each on the output of the previous one.
+
+    With `fuse=True`, a full cube directly followed by a Represent runs as a
+    CubeAndRepresent, which only aggregates the grouping sets Represent
+    reads. The fused cube is a different operator with its own cache key,
+    so fusion is opt-in.
+
+    The operators are stored as a tuple, since they are composed once when
+    the pipeline is built; compose a new pipeline with `|` to extend it.
+    """
+    def __init__(self, operators: Iterable[MraOperator], fuse: bool = False):
+        self.operators: Tuple[MraOperator, ...] = tuple(operators)
+        self.fuse = fuse
+        # Compose the operators once into a single callable, so running the
+        # pipeline does not iterate over the operator list.
+        self._fused = reduce(
+            lambda f, op: (lambda d, _f=f, _op=op: _op(_f(d))),
+            self._rewrite(self.operators) if fuse else self.operators,
+            lambda d: d)
+
+    @staticmethod
+    def _rewrite(
+            operators: Iterable[MraOperator]) -> List[MraOperator]:
+        """
+        Replaces each cube that feeds a Represent with a CubeAndRepresent,
+        so only the grouping sets that Represent reads are aggregated.
+        """
+        rewritten = []
+        for op in operators:
+            if (type(op) is Represent and rewritten
+                    and type(rewritten[-1]) is CreateRelationSpaceByCube
+                    and rewritten[-1].grouping_sets is None):
+                rewritten[-1] = CubeAndRepresent.fuse(rewritten[-1], op)
+            else:
+                rewritten.append(op)
+        return rewritten
 
     def _execute(self, data: MraData) -> MraData:
-        result = data
-        for op in self.operators:
-            result = op(result)
-        return result
+        return self._fused(data)
 
     def __or__(self, other: 'MraOperator') -> 'Pipeline':
         if isinstance(other, Pipeline):
-            return Pipeline(self.operators + other.operators)
-        return Pipeline(self.operators + [other])
+            return Pipeline(self.operators + other.operators,
+                            fuse=self.fuse or other.fuse)
+        return Pipeline(self.operators + (other,), fuse=self.fuse)
 
 # ==============================================================================
 # Concrete Operator Implementations
 # ==============================================================================
 
+def _with_contiguous_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Returns `df` with every NumPy-backed column stored contiguously.
+
+    Aggregation results can come back with column-major blocks, in which
+    each column is a strided view; downstream elementwise operations on
+    such columns are much slower than on contiguous ones.
+    """
+    result = df
+    for col in df.columns:
+        if not isinstance(df[col].array, pd.arrays.NumpyExtensionArray):
+            continue
+        values = df[col].to_numpy()
+        if not values.flags['C_CONTIGUOUS']:
+            if result is df:
+                result = df.copy(deep=False)
+            result[col] = np.ascontiguousarray(values)
+    return result
+
+
+# Partial aggregates that can be rolled up from a finer grouping, mapped to
+# the function that combines them. A mean is carried as a (sum, count) pair.
+_ROLLUP_AGGREGATIONS = {'sum': 'sum', 'count': 'sum', 'min': 'min',
+                        'max': 'max'}
+
+
 class CreateRelationSpaceByCube(MraOperator):
+    """
+    Aggregates a DataFrame over every subset of the grouping keys.
+
+    The input may also be an iterable of DataFrame chunks, such as
+    `pd.read_csv(..., chunksize=...)`, for data that does not fit in memory.
+    Chunked input requires grouping keys and aggregations that can be rolled
+    up from partial aggregates.
+    """
+    # Below this many grouping sets (three grouping keys), aggregation runs
+    # serially as the thread pool would cost more than it saves.
+    MIN_PARALLEL_GROUPS = 8
+    # Cache files are named with this prefix, so eviction never touches other
+    # files in a shared `cache_dir`.
+    CACHE_PREFIX = 'mra_cube_'
+
     def __init__(self, grouping_keys: List[str],
-                 aggregations: Dict[str, Any]):
+                 aggregations: Dict[str, Any],
+                 max_workers: int = 1,
+                 cache_dir: str = None,
+                 max_cached: int = 16,
+                 grouping_sets: List[List[str]] = None):
+        """
+        Args:
+            grouping_keys: The dimensions of the cube.
+            aggregations: The aggregation of each measure column.
+            max_workers: Threads used to aggregate the grouping sets; None
+                         uses the number of CPUs. The grouping sets are
+                         independent and pandas releases the GIL while
+                         grouping, but pandas does not guarantee that
+                         concurrent groupbys on one frame are thread-safe,
+                         so grouping sets are aggregated serially by
+                         default.
+            cache_dir: If given, cubes of DataFrame inputs are stored in this
+                       directory, keyed by the grouping keys, aggregations
+                       and a hash of the data, and reused by later runs.
+                       Only cubes whose aggregations are all named (e.g.
+                       'sum') are cached.
+            max_cached: The number of cubes kept in `cache_dir`; the least
+                        recently used ones are evicted. Files not written
+                        by the cube are left alone.
+            grouping_sets: The subsets of the grouping keys to aggregate
+                           over; defaults to all of them.
+        """
         self.grouping_keys = grouping_keys
         self.aggregations = aggregations
+        self.max_workers = max_workers
+        self.cache_dir = cache_dir
+        self.max_cached = max_cached
+        self.grouping_sets = (None if grouping_sets is None
+                              else {frozenset(g) for g in grouping_sets})
+        # The grouping sets in power set order, with their schemas, built
+        # once rather than on every call.
+        power_set = chain.from_iterable(
+            combinations(grouping_keys, r)
+            for r in range(len(grouping_keys) + 1)
+        )
+        self._groups = tuple(
+            group for group in power_set
+            if self.grouping_sets is None
+            or frozenset(group) in self.grouping_sets)
+        self._group_schemas = tuple(
+            RelationSchema(list(group)) for group in self._groups)
 
-    def _execute(self, data: pd.DataFrame) -> RelationSpace:
+    def _cacheable(self) -> bool:
+        """
+        Whether the cube can be cached. Aggregations other than named ones
+        (e.g. np.sum or a lambda) have no stable key across runs.
+        """
+        return all(isinstance(func, str)
+                   for func in self.aggregations.values())
+
+    def _cache_path(self, data: pd.DataFrame) -> str:
+        """The cache file of the cube of `data`."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr((
+            list(self.grouping_keys),
+            sorted(self.aggregations.items(), key=lambda item: item[0]),
+            list(data.columns),
+            # Values hash alike across dtypes (e.g. object and category).
+            [repr(dtype) for dtype in data.dtypes],
+            None if self.grouping_sets is None
+            else sorted(sorted(g) for g in self.grouping_sets),
+        )).encode())
+        digest.update(
+            pd.util.hash_pandas_object(data, index=False).to_numpy().tobytes())
+        return os.path.join(self.cache_dir,
+                            f"{self.CACHE_PREFIX}{digest.hexdigest()}.pkl")
+
+    def _evict_cached(self):
+        """
+        Removes the least recently used cubes beyond `max_cached`. Only files
+        written by this class are considered.
+        """
+        paths = [os.path.join(self.cache_dir, name)
+                 for name in os.listdir(self.cache_dir)
+                 if name.startswith(self.CACHE_PREFIX)
+                 and name.endswith('.pkl')]
+        paths.sort(key=os.path.getmtime, reverse=True)
+        for path in paths[self.max_cached:]:
+            os.remove(path)
+
+    def _project(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Keeps only the grouping keys and aggregated columns of `data`, so
+        hashing and grouping never scan columns the cube does not use.
+        """
+        needed = list(dict.fromkeys([*self.grouping_keys, *self.aggregations]))
+        if len(needed) == len(data.columns):
+            return data
+        return data[needed]
+
+    def _partial_aggregations(self) -> Dict[str, List[str]]:
+        """
+        Decomposes the aggregations into partial aggregates that can be
+        rolled up from a finer grouping. Returns None if any aggregation is
+        not decomposable.
+        """
+        partials = {}
+        for col, func in self.aggregations.items():
+            if func == 'mean':
+                partials[col] = ['sum', 'count']
+            elif isinstance(func, str) and func in _ROLLUP_AGGREGATIONS:
+                partials[col] = [func]
+            else:
+                return None
+        return partials
+
+    def _finalize(self, rolled: Union[pd.DataFrame, pd.Series]) -> dict:
+        """Combines rolled-up partial aggregates into the final columns."""
+        return {
+            col: (rolled[(col, 'sum')] / rolled[(col, 'count')]
+                  if func == 'mean' else rolled[(col, func)])
+            for col, func in self.aggregations.items()
+        }
+
+    def _leaf(
+            self,
+            data: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+            partials: Dict[str, List[str]],
+            rollup: Dict[Tuple[str, str], str]
+    ) -> pd.DataFrame:
+        """
+        Aggregates the input into partial aggregates at the finest grouping.
+        Chunked input is aggregated one chunk at a time and the chunks'
+        partial aggregates are rolled up, so only one chunk is in memory.
+        """
+        # NaN keys are kept so coarser sets still count those rows.
+        def aggregate_chunk(chunk: pd.DataFrame) -> pd.DataFrame:
+            return self._project(chunk).groupby(
+                self.grouping_keys, sort=False, observed=True,
+                dropna=False).agg(partials)
+
+        if isinstance(data, pd.DataFrame):
+            return aggregate_chunk(data)
+        chunk_leaves = [aggregate_chunk(chunk) for chunk in data]
+        if not chunk_leaves:
+            raise ValueError(
+                "CreateRelationSpaceByCube received no DataFrame chunks.")
+        return pd.concat(chunk_leaves).groupby(
+            level=self.grouping_keys, sort=False, observed=True,
+            dropna=False).agg(rollup)
+
+    def _execute(
+            self,
+            data: Union[pd.DataFrame, Iterable[pd.DataFrame]]
+    ) -> RelationSpace:
         if not isinstance(data, pd.DataFrame):
+            return self._create(data)
+        data = self._project(data)
+        if self.cache_dir is None or not self._cacheable():
+            return self._create(data)
+
+        path = self._cache_path(data)
+        try:
+            # Another process may evict the file at any point.
+            os.utime(path)
+            relation_space = pd.read_pickle(path)
+        except FileNotFoundError:
+            pass
+        else:
+            logger.debug("Loading cached cube for keys: %s",
+                         self.grouping_keys)
+            return relation_space
+
+        relation_space = self._create(data)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Write to a temporary file first so readers never see a partial cube.
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        pd.to_pickle(relation_space, tmp_path)
+        os.replace(tmp_path, path)
+        self._evict_cached()
+        return relation_space
+
+    def _create(
+            self,
+            data: Union[pd.DataFrame, Iterable[pd.DataFrame]]
+    ) -> RelationSpace:
+        """Computes the relation space of the cube."""
+        chunked = not isinstance(data, pd.DataFrame)
+        if chunked and (isinstance(data, (str, bytes, Mapping))
+                        or not isinstance(data, Iterable)):
             raise TypeError("CreateRelationSpaceByCube expects a DataFrame.")
 
         dims = RelationSchema(self.grouping_keys)
         relation_space = RelationSpace(dimensions=dims)
-        power_set = chain.from_iterable(
-            combinations(self.grouping_keys, r)
-            for r in range(len(self.grouping_keys) + 1)
-        )
 
-        print(f"  > Generating cube for keys: {self.grouping_keys}")
-        for group in power_set:
+        # The grand total only needs the aggregated columns.
+        agg_columns = list(self.aggregations)
+
+        partials = self._partial_aggregations()
+        leaf = None
+        if partials is not None and self.grouping_keys:
+            # Aggregate the input once at the finest grouping; every coarser
+            # grouping set is rolled up from these (far fewer) leaf rows.
+            rollup = {(col, part): _ROLLUP_AGGREGATIONS[part]
+                      for col, parts in partials.items() for part in parts}
+            leaf = self._leaf(data, partials, rollup)
+        elif chunked:
+            raise ValueError(
+                "Chunked input requires grouping keys and aggregations that "
+                f"can be rolled up ({sorted(_ROLLUP_AGGREGATIONS)} or "
+                "'mean').")
+
+        def aggregate(group: Tuple[str, ...]) -> pd.DataFrame:
             group_list = list(group)
-            if not group_list:
-                agg_df = data.agg(self.aggregations).to_frame().T
+            if leaf is not None:
+                if not group_list:
+                    agg_df = pd.Series(
+                        self._finalize(leaf.agg(rollup))).to_frame().T
+                else:
+                    rolled = leaf.groupby(level=group_list, sort=False,
+                                          observed=True).agg(rollup)
+                    agg_df = pd.DataFrame(
+                        self._finalize(rolled)).reset_index()
+            elif not group_list:
+                agg_df = data[agg_columns].agg(
+                    self.aggregations).to_frame().T
             else:
-                agg_df = data.groupby(group_list).agg(
+                agg_df = data.groupby(group_list, sort=False,
+                                      observed=True).agg(
                     self.aggregations).reset_index()
-            dimensional_schema = RelationSchema(group_list)
-            relation_space.add_relation(agg_df, dimensional_schema)
+            return _with_contiguous_columns(agg_df)
+
+        logger.debug("Generating cube for keys: %s", self.grouping_keys)
+        groups = self._groups
+        if (len(groups) >= self.MIN_PARALLEL_GROUPS
+                and self.max_workers != 1):
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                results = list(pool.map(aggregate, groups))
+        else:
+            results = [aggregate(group) for group in groups]
+
+        # Relations are added in power set order, whatever finished first.
+        for schema, agg_df in zip(self._group_schemas, results):
+            relation_space.add_relation(agg_df, schema)
 
         return relation_space
 
 class Represent(MraOperator):
+    # Below this many distinct region partitions, grouping runs serially as
+    # the thread pool would cost more than it saves.
+    MIN_PARALLEL_PARTITIONS = 4
+
     def __init__(self, region_schemas: List[RelationSchema],
-                 feature_schemas: List[RelationSchema]):
+                 feature_schemas: List[RelationSchema],
+                 max_workers: int = 1):
+        """
+        Args:
+            region_schemas: The region schemas to slice the space by.
+            feature_schemas: The feature schemas of each slice tuple.
+            max_workers: Threads used to partition relations by region; None
+                         uses the number of CPUs. pandas releases the GIL
+                         while grouping, but does not guarantee that
+                         concurrent groupbys on one frame are thread-safe,
+                         so partitions are computed serially by default.
+        """
         self.region_schemas = region_schemas
         self.feature_schemas = feature_schemas
+        self.max_workers = max_workers
+
+    def source_schemas(
+            self,
+            dimensions: RelationSchema
+    ) -> List[RelationSchema]:
+        """
+        The dimensional schemas of the relations read from a RelationSpace
+        with the given dimensions.
+        """
+        dim_attrs = frozenset(dimensions.attributes)
+        return list(dict.fromkeys(
+            RelationSchema(list(
+                (frozenset(r_schema.attributes)
+                 | frozenset(f_schema.attributes)) & dim_attrs))
+            for r_schema in self.region_schemas
+            for f_schema in self.feature_schemas))
+
+    @staticmethod
+    def _partition(
+            source_relation: pd.DataFrame,
+            region_cols: List[str]
+    ) -> Tuple[List[RelationTuple], np.ndarray, np.ndarray]:
+        """
+        Splits a relation into its regions over the given columns with a
+        single sort of the group codes, instead of materializing a DataFrame
+        per group. `region_cols` must be sorted, as the attributes of a
+        RelationSchema are.
+
+        Returns:
+            The region tuples in order of first appearance, the relation's
+            row positions ordered by region, and the offsets delimiting each
+            region's rows in that order. Rows with missing region values
+            belong to no region.
+        """
+        column = (source_relation[region_cols[0]]
+                  if len(region_cols) == 1 else None)
+        if (column is not None and len(column)
+                and column.is_monotonic_increasing):
+            # The rows are already grouped by region (a monotonic column has
+            # no missing values), so the regions start wherever the value
+            # changes, without hashing or sorting.
+            values = column.to_numpy()
+            starts = np.flatnonzero(np.r_[True, values[1:] != values[:-1]])
+            order = np.arange(len(values))
+            offsets = np.r_[starts, len(values)]
+        else:
+            codes = source_relation.groupby(
+                region_cols, sort=False, observed=True).ngroup()
+            codes = codes.fillna(-1).to_numpy(dtype=np.int64)
+            order = np.argsort(codes, kind='stable')
+            n_regions = int(codes.max()) + 1 if len(codes) else 0
+            offsets = np.searchsorted(codes[order], np.arange(n_regions + 1))
+
+        first_rows = order[offsets[:-1]]
+        region_values = zip(*(source_relation[col].take(first_rows).tolist()
+                              for col in region_cols))
+        # The region columns are sorted, so pairing them with the values in
+        # order already gives canonical tuples, without a dict and a sort.
+        regions = [RelationTuple(tuple(zip(region_cols, values)))
+                   for values in region_values]
+        return regions, order, offsets
 
     def _execute(self, data: RelationSpace) -> SliceRelation:
         if not isinstance(data, RelationSpace):
             raise TypeError("Represent expects a RelationSpace object.")
 
-        print(f"  > Representing RelationSpace into slices...")
+        logger.debug("Representing RelationSpace into slices")
         slice_relation = SliceRelation(dimensions=data.dimensions)
 
+        # Source relations and their column sets, looked up once per
+        # dimensional schema rather than once per schema pair.
+        sources: Dict[RelationSchema, Tuple[pd.DataFrame, frozenset]] = {}
+        dim_attrs = frozenset(data.dimensions.attributes)
+        # Per-feature-schema keys, built once instead of per schema pair.
+        feature_keys = [
+            (f_schema, list(f_schema.attributes),
+             frozenset(f_schema.attributes))
+            for f_schema in self.feature_schemas
+        ]
+
+        # Resolve the source relation of every (region, feature) schema pair.
+        tasks = []
         for r_schema in self.region_schemas:
-            for f_schema in self.feature_schemas:
-                combined_attrs = set(r_schema.attributes + f_schema.attributes)
-                target_dim_attrs = combined_attrs.intersection(
-                    data.dimensions.attributes)
-                target_dim_schema = RelationSchema(list(target_dim_attrs))
-                source_relation = data.get_relation(target_dim_schema)
-
-                if source_relation is None or not combined_attrs.issubset(
-                        source_relation.columns):
+            region_cols = list(r_schema.attributes)
+            region_attrs = frozenset(region_cols)
+            for f_schema, feature_cols, f_attrs in feature_keys:
+                combined_attrs = region_attrs | f_attrs
+                target_dim_schema = RelationSchema(
+                    list(combined_attrs & dim_attrs))
+                if target_dim_schema not in sources:
+                    relation = data.get_relation(target_dim_schema)
+                    sources[target_dim_schema] = (
+                        relation,
+                        None if relation is None
+                        else frozenset(relation.columns))
+                source_relation, source_cols = sources[target_dim_schema]
+
+                if source_relation is None or not combined_attrs <= source_cols:
                     continue
+                tasks.append(
+                    (r_schema, f_schema, feature_cols, source_relation))
 
-                region_cols = list(r_schema.attributes)
-                feature_cols = list(f_schema.attributes)
+        # Region partitions keyed by (source relation, region columns), so a
+        # region schema shared by several feature schemas is grouped once.
+        to_partition = {
+            (id(source_relation), r_schema.attributes): source_relation
+            for r_schema, _, _, source_relation in tasks
+            if r_schema.attributes
+        }
+        keys = list(to_partition)
+        if (len(keys) >= self.MIN_PARALLEL_PARTITIONS
+                and self.max_workers != 1):
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                results = list(pool.map(
+                    lambda key: self._partition(to_partition[key],
+                                                list(key[1])),
+                    keys))
+        else:
+            results = [self._partition(to_partition[key], list(key[1]))
+                       for key in keys]
+        partition_cache = dict(zip(keys, results))
 
-                if not region_cols:
-                    region_tuple = create_relation_tuple({})
-                    feature_data = source_relation[feature_cols].copy()
-                    slice_relation.add_slice_tuple(
-                        region_tuple, f_schema, feature_data)
-                else:
-                    for region_vals, group_df in source_relation.groupby(
-                            region_cols):
-                        region_dict = dict(zip(region_cols,
-                            region_vals if isinstance(region_vals, tuple)
-                            else (region_vals,)))
-                        region_tuple = create_relation_tuple(region_dict)
-                        feature_data = group_df[feature_cols].copy(
-                            ).reset_index(drop=True)
-                        slice_relation.add_slice_tuple(
-                            region_tuple, f_schema, feature_data)
+        # Emit the slice tuples in schema order on the calling thread.
+        for r_schema, f_schema, feature_cols, source_relation in tasks:
+            if not r_schema.attributes:
+                feature_data = source_relation[feature_cols]
+                slice_relation.add_slice_tuple(
+                    EMPTY_REGION_TUPLE, f_schema, feature_data)
+                continue
+
+            regions, order, offsets = partition_cache[
+                (id(source_relation), r_schema.attributes)]
+            # Reorder each feature column by region once; every region's
+            # feature table is then built from contiguous slices of it.
+            columns = {col: source_relation[col].array.take(order)
+                       for col in feature_cols}
+            for i, region_tuple in enumerate(regions):
+                start, end = offsets[i], offsets[i + 1]
+                feature_data = pd.DataFrame(
+                    {col: values[start:end] for col, values in columns.items()},
+                    copy=False)
+                slice_relation.add_slice_tuple(
+                    region_tuple, f_schema, feature_data)
 
         return slice_relation
 
+class CubeAndRepresent(MraOperator):
+    """
+    `CreateRelationSpaceByCube | Represent` in one operator, which only
+    aggregates the grouping sets that Represent reads instead of the whole
+    cube. Pipelines substitute it for that pair of operators.
+    """
+    def __init__(self, grouping_keys: List[str],
+                 aggregations: Dict[str, Any],
+                 region_schemas: List[RelationSchema],
+                 feature_schemas: List[RelationSchema],
+                 max_workers: int = 1,
+                 cache_dir: str = None,
+                 max_cached: int = 16):
+        """
+        Args:
+            grouping_keys: The dimensions of the cube.
+            aggregations: The aggregation of each measure column.
+            region_schemas: The region schemas to slice the space by.
+            feature_schemas: The feature schemas of each slice tuple.
+            max_workers, cache_dir, max_cached: As for
+                CreateRelationSpaceByCube.
+        """
+        self.represent = Represent(region_schemas, feature_schemas,
+                                   max_workers=max_workers)
+        self.cube = CreateRelationSpaceByCube(
+            grouping_keys, aggregations, max_workers=max_workers,
+            cache_dir=cache_dir, max_cached=max_cached,
+            grouping_sets=[
+                schema.attributes for schema in self.represent.source_schemas(
+                    RelationSchema(grouping_keys))])
+
+    @classmethod
+    def fuse(cls, cube: CreateRelationSpaceByCube,
+             represent: Represent) -> 'CubeAndRepresent':
+        """Fuses a full cube and the Represent that consumes it."""
+        fused = cls(cube.grouping_keys, cube.aggregations,
+                    represent.region_schemas, represent.feature_schemas,
+                    max_workers=cube.max_workers, cache_dir=cube.cache_dir,
+                    max_cached=cube.max_cached)
+        fused.represent = represent
+        return fused
+
+    def _execute(
+            self,
+            data: Union[pd.DataFrame, Iterable[pd.DataFrame]]
+    ) -> SliceRelation:
+        return self.represent(self.cube(data))
+
 class SliceTransform(MraOperator):
     """
     Transforms feature tables within a SliceRelation by applying a sequence
     of slice transformations.
     """
+    # Below this many regions, regions are transformed serially as the
+    # thread pool would cost more than it saves.
+    MIN_PARALLEL_REGIONS = 64
+
     def __init__(
             self,
             slice_transformations: List[SliceTransformation],
             dimensions: RelationSchema,
             drill_down_regions: Set[RelationTuple] = None,
             parent_region_schemas: Set[RelationSchema] = None,
+            max_workers: int = 1,
     ):
+        """
+        Args:
+            slice_transformations: The transformations to apply.
+            dimensions: The dimensions of the resulting SliceRelation.
+            drill_down_regions: If given, only descendants of these regions
+                                are transformed and kept.
+            parent_region_schemas: The schemas of the drill-down regions.
+            max_workers: Threads used to transform regions; None uses the
+                         number of CPUs. Transformations are then called
+                         concurrently and must be thread-safe, so regions
+                         are transformed serially by default. Row-wise
+                         transformations always run in one batched call.
+        """
         self.slice_transformations = slice_transformations
         self.dimensions = dimensions
         self.drill_down_regions = drill_down_regions
         self.parent_region_schemas = parent_region_schemas
+        self.max_workers = max_workers
+        self._projection_memo: Dict[Tuple[str, ...], List[int]] = {}
 
     def _is_descendant(
             self,
             region_to_check: RelationTuple,
             parent_regions: Set[RelationTuple],
-            parent_schemas: Set[RelationSchema]
+            parent_schemas: Set[RelationSchema],
+            memo: Dict[Tuple[str, ...], List[int]] = None
     ) -> bool:
         """
         Checks if a region is a valid descendant based on its parents'
         schemas and values.
+
+        `memo` caches, per region schema, which one-attribute projections
+        are parent schemas, so regions sharing a schema build the projected
+        schemas only once. It is only valid for a fixed `parent_schemas`.
         """
-        components = list(region_to_check)
+        # Relation tuples are sorted by key, so dropping one component of the
+        # sorted region directly gives a canonical parent tuple.
+        components = tuple(sorted(region_to_check))
         k = len(components)
 
         if k == 0:
             return True
 
-        for i in range(k):
-            projection_components = components[:i] + components[i+1:]
-            
-            proj_schema = RelationSchema(
-                [key for key, val in projection_components])
-            if proj_schema not in parent_schemas:
-                continue
+        keys = tuple(key for key, _ in components)
+        parent_positions = None if memo is None else memo.get(keys)
+        if parent_positions is None:
+            parent_positions = [
+                i for i in range(k)
+                if RelationSchema(list(keys[:i] + keys[i+1:]))
+                in parent_schemas
+            ]
+            if memo is not None:
+                memo[keys] = parent_positions
 
-            parent_candidate = create_relation_tuple(
-                dict(projection_components))
+        for i in parent_positions:
+            parent_candidate = components[:i] + components[i+1:]
             if parent_candidate not in parent_regions:
                 return False
-        
+
         return True
 
-    def _execute(
+    def _apply_row_wise(
             self,
-            data: SliceRelation
-    ) -> SliceRelation:
-        if not isinstance(data, SliceRelation):
-            raise TypeError("SliceTransform expects a SliceRelation object.")
+            data: SliceRelation,
+            transformation: SliceTransformation
+    ) -> Dict[int, pd.DataFrame]:
+        """
+        Applies a row-wise transformation to the stacked feature table of all
+        regions in a single call, then splits the result back per region.
 
-        print("  > Transforming slices...")
-        new_slice_relation = SliceRelation(dimensions=self.dimensions)
+        Returns:
+            The transformed feature table of each region, keyed by the
+            region's position in `data.data`.
+        """
+        table = data.feature_table(transformation.feature_schema)
+        if table.empty:
+            return {}
+
+        region_ids = table[REGION_ID_COLUMN].to_numpy()
+        transformed = transformation(table).drop(columns=REGION_ID_COLUMN)
+
+        # Rows of a region are contiguous in the stacked table.
+        starts = np.flatnonzero(
+            np.r_[True, region_ids[1:] != region_ids[:-1]])
+        ends = np.r_[starts[1:], len(region_ids)]
+        return {
+            int(region_ids[start]): transformed.iloc[start:end].reset_index(
+                drop=True)
+            for start, end in zip(starts, ends)
+        }
+
+    def _prepare(
+            self,
+            data: SliceRelation
+    ) -> Tuple[Dict[RelationSchema, SliceTransformation],
+               Dict[RelationSchema, Dict[int, pd.DataFrame]]]:
+        """
+        Hands the reference data to the transformations that need it and
+        runs the row-wise transformations over all regions at once.
 
+        Returns:
+            The transformations keyed by feature schema, and the batched
+            row-wise results keyed by feature schema and region position.
+        """
         transform_map = {t.feature_schema: t for t in
                          self.slice_transformations}
+        self._projection_memo = {}
+
+        reference_features = data.data.get(EMPTY_REGION_TUPLE, {})
 
-        empty_region_tuple = create_relation_tuple({})
-        reference_features = data.data.get(empty_region_tuple, {})
-        
         for transformation in self.slice_transformations:
             if transformation.require_reference_data:
                 ref_data = reference_features.get(
                     transformation.feature_schema)
                 transformation.reference_data = ref_data
 
-        for region, features in data.data.items():
-            if region == empty_region_tuple:
+        # Row-wise transformations run once over all regions' rows.
+        batched = {
+            feature_schema: self._apply_row_wise(data, transformation)
+            for feature_schema, transformation in transform_map.items()
+            if transformation.row_wise
+        }
+        return transform_map, batched
+
+    def _keeps_region(self, region: RelationTuple) -> bool:
+        """Checks a region against the drill-down parents, if any."""
+        if self.drill_down_regions is None:
+            return True
+        return self._is_descendant(
+            region, self.drill_down_regions, self.parent_region_schemas,
+            self._projection_memo)
+
+    def _transform_features(
+            self,
+            region_id: int,
+            features: Dict[RelationSchema, pd.DataFrame],
+            transform_map: Dict[RelationSchema, SliceTransformation],
+            batched: Dict[RelationSchema, Dict[int, pd.DataFrame]]
+    ) -> Dict[RelationSchema, pd.DataFrame]:
+        """
+        Transforms the feature tables of one region. Transformed tables are
+        keyed by their output schema; the other tables are passed through.
+        """
+        new_features = {}
+        passed_through = {}
+
+        for feature_schema, feature_df in features.items():
+            transformation = transform_map.get(feature_schema)
+            if transformation is None:
+                passed_through[feature_schema] = feature_df
                 continue
+            transformed_df = batched.get(feature_schema, {}).get(region_id)
+            if transformed_df is None:
+                transformed_df = transformation(feature_df)
+            output_schema = RelationSchema(list(transformed_df.columns))
+            new_features[output_schema] = transformed_df
 
-            if self.drill_down_regions is not None:
-                if not self._is_descendant(
-                        region,
-                        self.drill_down_regions,
-                        self.parent_region_schemas):
-                    continue
+        # Passed-through tables follow the transformed ones.
+        new_features.update(passed_through)
+        return new_features
+
+    def _execute(
+            self,
+            data: SliceRelation
+    ) -> SliceRelation:
+        if not isinstance(data, SliceRelation):
+            raise TypeError("SliceTransform expects a SliceRelation object.")
+
+        logger.debug("Transforming slices")
+        new_slice_relation = SliceRelation(dimensions=self.dimensions)
+
+        transform_map, batched = self._prepare(data)
+
+        kept = [
+            (region_id, region, features)
+            for region_id, (region, features) in enumerate(data.data.items())
+            if region and self._keeps_region(region)
+        ]
 
-            processed_schemas = set()
+        def transform(item) -> Dict[RelationSchema, pd.DataFrame]:
+            region_id, _, features = item
+            return self._transform_features(
+                region_id, features, transform_map, batched)
 
-            for feature_schema, feature_df in features.items():
-                if feature_schema in transform_map:
-                    transformation = transform_map[feature_schema]
-                    transformed_df = transformation(feature_df.copy())
-                    output_schema = RelationSchema(
-                        list(transformed_df.columns))
-                    new_slice_relation.add_slice_tuple(
-                        region, output_schema, transformed_df)
-                    processed_schemas.add(feature_schema)
+        if (len(kept) >= self.MIN_PARALLEL_REGIONS
+                and self.max_workers != 1):
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                results = list(pool.map(transform, kept))
+        else:
+            results = [transform(item) for item in kept]
 
-            for feature_schema, feature_df in features.items():
-                if feature_schema not in processed_schemas:
-                    new_slice_relation.add_slice_tuple(
-                        region, feature_schema, feature_df.copy())
+        for (_, region, _), new_features in zip(kept, results):
+            new_slice_relation.add_slice_tuples(region, new_features)
 
         return new_slice_relation
 
 class SliceSelect(MraOperator):
-    def __init__(self, predicate_func: Callable[
-            [RelationTuple, Dict[RelationSchema, pd.DataFrame]], bool]):
+    """
+    Selects the slice tuples of a SliceRelation whose regions satisfy the
+    given predicates. The reference (empty) region is always kept.
+
+    `predicate_func` is called once per region with its feature tables.
+    `feature_predicates` maps a feature schema to a row-wise predicate that
+    is evaluated once over the stacked feature table of all regions; a region
+    passes if every one of its rows satisfies the predicate.
+    `region_predicates` maps a feature schema to a predicate over that
+    stacked table grouped by region, returning one boolean per region, e.g.
+    `lambda regions: regions['Cost'].sum() > 100`. Regions without a table
+    of a predicate's feature schema do not pass it.
+
+    Feature predicates are reordered by selectivity across calls, so their
+    evaluation order is not fixed and they must be free of side effects.
+    """
+    def __init__(
+            self,
+            predicate_func: Callable[
+                [RelationTuple, Dict[RelationSchema, pd.DataFrame]],
+                bool] = None,
+            feature_predicates: Dict[
+                RelationSchema, Callable[[pd.DataFrame], pd.Series]] = None,
+            region_predicates: Dict[
+                RelationSchema,
+                Callable[[DataFrameGroupBy], pd.Series]] = None,
+    ):
+        if (predicate_func is None and not feature_predicates
+                and not region_predicates):
+            raise ValueError(
+                "SliceSelect requires a predicate_func, feature_predicates "
+                "or region_predicates.")
         self.predicate_func = predicate_func
+        self.feature_predicates = feature_predicates
+        self.region_predicates = region_predicates
+        # [rejected, evaluated] region counts per feature predicate, used to
+        # evaluate the most selective predicates first on later calls. The
+        # lock keeps them consistent when one SliceSelect runs concurrently.
+        self._predicate_stats: Dict[RelationSchema, List[int]] = {
+            feature_schema: [0, 0]
+            for feature_schema in (feature_predicates or {})
+        }
+        self._stats_lock = threading.Lock()
+
+    def _rejection_rate(self, feature_schema: RelationSchema) -> float:
+        rejected, evaluated = self._predicate_stats[feature_schema]
+        return rejected / evaluated if evaluated else 0.0
+
+    def _passing_region_ids(self, data: SliceRelation) -> Set[int]:
+        """
+        Evaluates the feature and region predicates over the stacked feature
+        tables and returns the positions in `data.data` of the regions
+        passing them all.
+
+        Feature predicates run most selective first, then region predicates,
+        each over only the rows of the regions that passed the previous ones,
+        stopping once none are left.
+        """
+        passing = set(range(len(data.data)))
+        with self._stats_lock:
+            ordered = sorted(self.feature_predicates or {},
+                             key=self._rejection_rate, reverse=True)
+        for feature_schema in ordered:
+            if not passing:
+                break
+            predicate = self.feature_predicates[feature_schema]
+            table = data.feature_table(feature_schema)
+            region_ids = table[REGION_ID_COLUMN].to_numpy()
+            candidate_rows = np.isin(region_ids, list(passing))
+            if not candidate_rows.all():
+                table = table[candidate_rows]
+                region_ids = region_ids[candidate_rows]
+
+            mask = pd.Series(np.asarray(predicate(table), dtype=bool))
+            region_ok = mask.groupby(region_ids, sort=False).all()
+            still_passing = passing & set(
+                region_ok.index[region_ok.to_numpy()])
+
+            with self._stats_lock:
+                stats = self._predicate_stats[feature_schema]
+                stats[0] += len(passing) - len(still_passing)
+                stats[1] += len(passing)
+            passing = still_passing
+
+        region_predicates = self.region_predicates or {}
+        for feature_schema, predicate in region_predicates.items():
+            if not passing:
+                break
+            table = data.feature_table(feature_schema)
+            table = table[table[REGION_ID_COLUMN].isin(passing)]
+            region_ok = predicate(table.groupby(REGION_ID_COLUMN, sort=False))
+            if (not isinstance(region_ok, pd.Series)
+                    or not pd.api.types.is_bool_dtype(region_ok.dtype)):
+                raise TypeError(
+                    f"The region predicate of {feature_schema} must return a "
+                    f"boolean pd.Series, got {type(region_ok).__name__}.")
+            if (region_ok.index.name != REGION_ID_COLUMN
+                    or not region_ok.index.isin(
+                        table[REGION_ID_COLUMN].unique()).all()):
+                raise ValueError(
+                    f"The region predicate of {feature_schema} must return a "
+                    f"Series indexed by '{REGION_ID_COLUMN}'.")
+            passing &= set(region_ok.index[
+                region_ok.to_numpy(dtype=bool, na_value=False)])
+        return passing
 
     def _execute(self, data: SliceRelation) -> SliceRelation:
         if not isinstance(data, SliceRelation):
             raise TypeError("SliceSelect expects a SliceRelation object.")
 
-        print(f"  > Selecting slices...")
+        logger.debug("Selecting slices")
         new_slice_relation = SliceRelation(dimensions=data.dimensions)
-        empty_region_tuple = create_relation_tuple({})
 
-        for region, features in data.data.items():
-            if region == empty_region_tuple:
+        passing_ids = None
+        if self.feature_predicates or self.region_predicates:
+            passing_ids = self._passing_region_ids(data)
+
+        for region_id, (region, features) in enumerate(data.data.items()):
+            if not region:
                 continue
 
-            if self.predicate_func(region, features):
-                for feature_schema, feature_df in features.items():
-                    new_slice_relation.add_slice_tuple(
-                        region, feature_schema, feature_df)
+            if passing_ids is not None and region_id not in passing_ids:
+                continue
+
+            if (self.predicate_func is None
+                    or self.predicate_func(region, features)):
+                new_slice_relation.add_slice_tuples(region, features)
 
-        if empty_region_tuple in data.data:
-            reference_features = data.data[empty_region_tuple]
-            for f_schema, f_df in reference_features.items():
-                new_slice_relation.add_slice_tuple(
-                    empty_region_tuple, f_schema, f_df)
+        if EMPTY_REGION_TUPLE in data.data:
+            new_slice_relation.add_slice_tuples(
+                EMPTY_REGION_TUPLE, data.data[EMPTY_REGION_TUPLE])
 
         return new_slice_relation
 
@@ -267,31 +956,153 @@ class SliceProject(MraOperator):
         if not isinstance(data, SliceRelation):
             raise TypeError("SliceProject expects a SliceRelation object.")
         
-        print(f"  > Projecting slices...")
+        logger.debug("Projecting slices")
         new_slice_relation = SliceRelation(dimensions=data.dimensions)
         
-        allowed_region_schemas = {
-            RelationSchema(list(rs.attributes)) for rs in self.region_schemas
-        }
+        # Relation tuples are sorted by key, so a region's keys are directly
+        # comparable to the sorted attributes of a schema.
+        allowed_region_keys = {rs.attributes for rs in self.region_schemas}
+        allowed_f_schemas = (None if self.feature_schemas is None
+                             else set(self.feature_schemas))
 
         for region, features in data.data.items():
-            current_region_schema = RelationSchema([k for k, v in region])
-            
-            if current_region_schema in allowed_region_schemas:
+            region_keys = tuple(k for k, _ in region)
+
+            if region_keys in allowed_region_keys:
                 features_to_keep = features
-                if self.feature_schemas is not None:
-                    allowed_f_schemas = set(self.feature_schemas)
+                if allowed_f_schemas is not None:
                     features_to_keep = {
                         fs: df for fs, df in features.items()
                         if fs in allowed_f_schemas
                     }
 
-                for f_schema, f_df in features_to_keep.items():
-                    new_slice_relation.add_slice_tuple(
-                        region, f_schema, f_df)
+                new_slice_relation.add_slice_tuples(region, features_to_keep)
 
         return new_slice_relation
 
+FlattenColumns = Dict[
+    str, Union[np.ndarray, pd.api.extensions.ExtensionArray]]
+FlattenChunks = Dict[
+    RelationSchema, List[Tuple[RelationTuple, int, FlattenColumns]]]
+
+
+def _flatten_region(
+        region: RelationTuple,
+        features: Dict[RelationSchema, pd.DataFrame]
+) -> Tuple[RelationSchema, int, FlattenColumns]:
+    """
+    Flattens one slice tuple into the feature columns of its rows: the cross
+    product of all of its non-empty feature tables. The region's values are
+    added when the relation is assembled.
+
+    Returns:
+        The region's dimensional schema, the row count and the columns.
+    """
+    tables = [df for df in features.values() if not df.empty]
+    names = [col for df in tables for col in df.columns]
+    if len(set(names)) < len(names):
+        # Overlapping feature columns need merge's suffixing.
+        return _flatten_region_by_merge(region, tables)
+
+    # The cross product is written directly into preallocated column arrays:
+    # the first table varies slowest, as in a chain of cross merges. Viewing
+    # a column as (outer, size, inner) lets one broadcast assignment write
+    # every row once, without intermediate products or repeat/tile copies.
+    # Extension arrays (nullable, categorical, ...) are taken by index
+    # instead, so that their dtype survives.
+    sizes = [len(df) for df in tables]
+    n = int(np.prod(sizes, dtype=np.int64))
+    columns = {}
+    inner = n
+    for df, size in zip(tables, sizes):
+        inner //= size
+        outer = n // (size * inner)
+        index = None
+        for col in df.columns:
+            values = df[col].array
+            if isinstance(values, pd.arrays.NumpyExtensionArray):
+                values = values.to_numpy()
+                out = np.empty(n, dtype=values.dtype)
+                out.reshape(outer, size, inner)[...] = values[None, :, None]
+            else:
+                if index is None:
+                    index = np.broadcast_to(
+                        np.arange(size)[None, :, None],
+                        (outer, size, inner)).reshape(-1)
+                out = values.take(index)
+            columns[col] = out
+
+    return RelationSchema([key for key, _ in region]), n, columns
+
+
+def _flatten_region_by_merge(
+        region: RelationTuple,
+        tables: List[pd.DataFrame]
+) -> Tuple[RelationSchema, int, FlattenColumns]:
+    """Flattens a slice tuple whose feature tables share column names."""
+    feature_product = tables[0].reset_index(drop=True)
+    for feature_df in tables[1:]:
+        feature_product = feature_product.merge(feature_df, how='cross')
+
+    n = len(feature_product)
+    columns = {}
+    for col in feature_product.columns:
+        values = feature_product[col].array
+        columns[col] = (values.to_numpy()
+                        if isinstance(values, pd.arrays.NumpyExtensionArray)
+                        else values)
+    return RelationSchema([key for key, _ in region]), n, columns
+
+
+def _build_relation_space(
+        dimensions: RelationSchema,
+        chunks_by_schema: FlattenChunks
+) -> RelationSpace:
+    """
+    Assembles flattened chunks into one relation per dimensional schema: the
+    region values repeated over their chunk's rows, then the feature columns.
+    """
+    relation_space = RelationSpace(dimensions=dimensions)
+    for dimensional_schema, chunks in chunks_by_schema.items():
+        counts = [n for _, n, _ in chunks]
+        chunk_of_row = np.repeat(np.arange(len(chunks)), counts)
+        final_columns = {}
+        # The regions of a schema share its sorted keys. Each region column
+        # is inferred from the values of all regions at once, so a missing
+        # value stays missing instead of being coerced to the others' type.
+        for i, key in enumerate(dimensional_schema.attributes):
+            values = pd.Series([region[i][1] for region, _, _ in chunks])
+            final_columns[key] = values.array.take(chunk_of_row)
+        column_names = dict.fromkeys(
+            col for _, _, columns in chunks for col in columns)
+        for col in column_names:
+            final_columns[col] = _concat_column(
+                [columns.get(col) for _, _, columns in chunks], counts)
+        relation_space.add_relation(
+            pd.DataFrame(final_columns), dimensional_schema)
+    return relation_space
+
+
+def _concat_column(parts: List[Any], counts: List[int]) -> Any:
+    """
+    Concatenates one column's chunks. Missing chunks (None) are padded with
+    the missing value of the column's dtype, and chunks of different dtypes
+    are combined as pandas would.
+    """
+    present = [part for part in parts if part is not None]
+    if (len(present) == len(parts)
+            and all(isinstance(part, np.ndarray) for part in parts)
+            and len({part.dtype for part in parts}) == 1):
+        return np.concatenate(parts)
+    reference = present[0]
+    filled = [
+        pd.api.extensions.take(reference, np.full(n, -1), allow_fill=True)
+        if part is None else part
+        for part, n in zip(parts, counts)]
+    return pd.concat([pd.Series(part) for part in filled],
+                     ignore_index=True).array
+
+
 class Flatten(MraOperator):
     def __init__(self, dimensions: RelationSchema):
         self.dimensions = dimensions
@@ -300,24 +1111,19 @@ class Flatten(MraOperator):
         if not isinstance(data, SliceRelation):
             raise TypeError("Flatten expects a SliceRelation object.")
 
-        print("  > Flattening SliceRelation to RelationSpace...")
-        new_relation_space = RelationSpace(dimensions=self.dimensions)
-        
+        logger.debug("Flattening SliceRelation to RelationSpace")
+
+        # Column arrays per dimensional schema, as (row count, columns)
+        # chunks, so that each output relation is assembled exactly once.
+        chunks_by_schema: FlattenChunks = defaultdict(list)
+
         for region, features in data.data.items():
             if not region:
                 continue
-            
-            region_df = pd.DataFrame([dict(region)])
-            final_df = region_df
-            
-            for feature_df in features.values():
-                if not feature_df.empty:
-                    final_df = final_df.merge(feature_df, how='cross')
-
-            dimensional_schema = RelationSchema(list(dict(region).keys()))
-            new_relation_space.add_relation(final_df, dimensional_schema)
+            dimensional_schema, n, columns = _flatten_region(region, features)
+            chunks_by_schema[dimensional_schema].append((region, n, columns))
 
-        return new_relation_space
+        return _build_relation_space(self.dimensions, chunks_by_schema)
 
 
 class Crawl(MraOperator):
@@ -329,12 +1135,31 @@ class Crawl(MraOperator):
                  ],
                  dimensions: RelationSchema,
                  drill_down_regions: Set[RelationTuple] = None,
-                 parent_region_schemas: Set[RelationSchema] = None):
+                 parent_region_schemas: Set[RelationSchema] = None,
+                 region_predicates: Dict[
+                     RelationSchema,
+                     Callable[[DataFrameGroupBy], pd.Series]] = None):
+        """
+        Args:
+            region_schemas: The region schemas to crawl.
+            slice_transformations: The transformations applied to each slice.
+            predicate_func: Selects slices one region at a time, after the
+                            transformations; may be None if
+                            `region_predicates` are given.
+            dimensions: The dimensions of the crawled space.
+            drill_down_regions: If given, only descendants of these regions
+                                are crawled.
+            parent_region_schemas: The schemas of the drill-down regions.
+            region_predicates: Select slices on aggregates of their
+                               transformed feature tables, for all regions
+                               in one vectorized call; see SliceSelect.
+        """
         self.region_schemas = region_schemas
         self.slice_transformations = slice_transformations
         self.feature_schemas = [t.feature_schema for t in
                                 self.slice_transformations]
         self.predicate_func = predicate_func
+        self.region_predicates = region_predicates
         self.dimensions = dimensions
         self.drill_down_regions = drill_down_regions
         self.parent_region_schemas = parent_region_schemas
@@ -342,24 +1167,30 @@ class Crawl(MraOperator):
         represent_schemas = self.region_schemas[:]
         needs_ref_data = any(t.require_reference_data for t in
                              self.slice_transformations)
-        empty_schema = RelationSchema([])
-        if needs_ref_data and empty_schema not in represent_schemas:
-            represent_schemas.append(empty_schema)
+        if needs_ref_data and EMPTY_SCHEMA not in represent_schemas:
+            represent_schemas.append(EMPTY_SCHEMA)
+
+        self._represent = Represent(
+            region_schemas=represent_schemas,
+            feature_schemas=self.feature_schemas
+        )
+        self._transform = SliceTransform(
+            slice_transformations=self.slice_transformations,
+            dimensions=self.dimensions,
+            drill_down_regions=self.drill_down_regions,
+            parent_region_schemas=self.parent_region_schemas
+        )
+        self._select = SliceSelect(
+            predicate_func=self.predicate_func,
+            region_predicates=self.region_predicates
+        )
 
+        # The full operator-by-operator pipeline, kept for inspecting the
+        # intermediate SliceRelations when debugging.
         self.internal_pipeline = (
-            Represent(
-                region_schemas=represent_schemas,
-                feature_schemas=self.feature_schemas
-            ) |
-            SliceTransform(
-                slice_transformations=self.slice_transformations,
-                dimensions=self.dimensions,
-                drill_down_regions=self.drill_down_regions,
-                parent_region_schemas=self.parent_region_schemas
-            ) |
-            SliceSelect(
-                predicate_func=self.predicate_func
-            ) |
+            self._represent |
+            self._transform |
+            self._select |
             SliceProject(
                 region_schemas=self.region_schemas
             ) |
@@ -367,9 +1198,20 @@ class Crawl(MraOperator):
                 dimensions=self.dimensions
             )
         )
+        # The pipeline _execute runs. Represent only emits the requested
+        # region schemas (plus the reference region, which SliceTransform
+        # drops), so the projection step is implied and left out.
+        self._pipeline = (
+            self._represent |
+            self._transform |
+            self._select |
+            Flatten(
+                dimensions=self.dimensions
+            )
+        )
 
     def _execute(self, data: RelationSpace) -> RelationSpace:
         if not isinstance(data, RelationSpace):
             raise TypeError("Crawl expects a RelationSpace as input.")
 
-        return self.internal_pipeline(data)
+        return self._pipeline(data)
@@ -1,12 +1,21 @@
+import os
+import tempfile
 import unittest
+from unittest import mock
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
 from typing import Set
 
 # Import data structures and operators to be tested
 from mra_data import (SliceRelation, RelationSchema, RelationTuple,
-                      create_relation_tuple)
-from mra_operators import SliceTransform, CreateRelationSpaceByCube, Crawl
+                      RelationSpace, create_relation_tuple)
+from mra_operators import (SliceTransform, CreateRelationSpaceByCube, Crawl,
+                           Represent, Flatten, SliceSelect, Pipeline,
+                           CubeAndRepresent)
 from slice_transformations.slice_transformation import SliceTransformation
+from slice_transformations.ratio_transformation import RatioTransformation
+from slice_transformations.support_transformation import SupportTransformation
 
 
 # A dummy transformation class for testing purposes
@@ -20,8 +29,379 @@ class CopyTransformation(SliceTransformation):
         return self._feature_schema
 
     def __call__(self, df):
-        # The transformation logic itself doesn't matter for this test
-        return df.copy()
+        # The transformation logic itself doesn't matter for this test, and
+        # the input may be returned as is since it is never modified.
+        return df
+
+
+class CreateRelationSpaceByCubeTest(unittest.TestCase):
+    """
+    Test suite for the CreateRelationSpaceByCube operator.
+    """
+
+    def test_rollup_matches_direct_aggregation(self):
+        """
+        Tests that relations rolled up from the finest grouping equal a
+        direct aggregation of the input for every grouping set.
+        """
+        data = pd.DataFrame({
+            'Device': ['Pixel', 'Pixel', 'iPhone', 'iPhone', None],
+            'Browser': ['Chrome', 'Safari', 'Safari', 'Safari', 'Edge'],
+            'Cost': [100, 200, 50, 150, 80],
+            'Clicks': [10.0, None, 5.0, 20.0, 8.0]
+        })
+        aggregations = {'Cost': 'sum', 'Clicks': 'mean'}
+        space = CreateRelationSpaceByCube(
+            grouping_keys=['Device', 'Browser'],
+            aggregations=aggregations
+        )(data)
+
+        for keys in (['Device'], ['Browser'], ['Device', 'Browser']):
+            expected = data.groupby(keys, sort=False).agg(
+                aggregations).reset_index()
+            pd.testing.assert_frame_equal(
+                space.get_relation(RelationSchema(keys)), expected)
+
+        total = space.get_relation(RelationSchema([]))
+        self.assertEqual(total['Cost'].iloc[0], 580)
+        self.assertAlmostEqual(total['Clicks'].iloc[0], 10.75)
+
+    def test_parallel_aggregation_matches_serial(self):
+        """
+        Tests that aggregating grouping sets on a thread pool yields the same
+        relations, in the same order, as aggregating serially.
+        """
+        data = pd.DataFrame({
+            'Device': ['Pixel', 'Pixel', 'iPhone', 'iPhone'],
+            'Browser': ['Chrome', 'Safari', 'Safari', 'Edge'],
+            'Country': ['US', 'US', 'CA', 'CA'],
+            'Cost': [100, 200, 50, 80]
+        })
+        kwargs = dict(grouping_keys=['Device', 'Browser', 'Country'],
+                      aggregations={'Cost': 'median'})
+
+        serial = CreateRelationSpaceByCube(**kwargs, max_workers=1)(data)
+        parallel = CreateRelationSpaceByCube(**kwargs, max_workers=4)(data)
+
+        self.assertEqual(list(parallel._relations), list(serial._relations))
+        for schema, relation in serial._relations.items():
+            pd.testing.assert_frame_equal(
+                parallel.get_relation(schema), relation)
+
+    def test_chunked_input_matches_whole_input(self):
+        """
+        Tests that aggregating an input chunk by chunk yields the same
+        relations as aggregating it at once.
+        """
+        data = pd.DataFrame({
+            'Device': ['Pixel', 'iPhone', 'Pixel', 'iPhone', 'Pixel'],
+            'Browser': ['Chrome', 'Safari', 'Safari', 'Safari', None],
+            'Cost': [100, 200, 50, 150, 80],
+            'Clicks': [10.0, 4.0, 5.0, 20.0, 8.0]
+        })
+        cube = CreateRelationSpaceByCube(
+            grouping_keys=['Device', 'Browser'],
+            aggregations={'Cost': 'sum', 'Clicks': 'mean'})
+
+        whole = cube(data)
+        chunked = cube(data.iloc[i:i + 2] for i in range(0, len(data), 2))
+
+        for schema, relation in whole._relations.items():
+            pd.testing.assert_frame_equal(
+                chunked.get_relation(schema), relation)
+
+    def test_chunked_input_requires_rollup_aggregations(self):
+        """
+        Tests that chunked input is rejected for aggregations that cannot be
+        rolled up from per-chunk results.
+        """
+        cube = CreateRelationSpaceByCube(
+            grouping_keys=['Device'], aggregations={'Cost': 'median'})
+        with self.assertRaises(ValueError):
+            cube([pd.DataFrame({'Device': ['Pixel'], 'Cost': [1]})])
+
+    def test_chunked_input_must_hold_chunks(self):
+        """
+        Tests that an empty iterable of chunks and a mapping of frames are
+        rejected with clear errors.
+        """
+        cube = CreateRelationSpaceByCube(
+            grouping_keys=['Device'], aggregations={'Cost': 'sum'})
+        with self.assertRaisesRegex(ValueError, 'no DataFrame chunks'):
+            cube(iter([]))
+        with self.assertRaises(TypeError):
+            cube({'a': pd.DataFrame({'Device': ['Pixel'], 'Cost': [1]})})
+
+    def test_cube_is_reused_from_cache_dir(self):
+        """
+        Tests that a cached cube is loaded instead of recomputed, and that a
+        change to the data misses the cache.
+        """
+        data = pd.DataFrame({
+            'Device': ['Pixel', 'iPhone', 'Pixel'],
+            'Cost': [100, 200, 50]
+        })
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cube = CreateRelationSpaceByCube(
+                grouping_keys=['Device'], aggregations={'Cost': 'sum'},
+                cache_dir=cache_dir, max_cached=1)
+            first = cube(data)
+
+            with mock.patch.object(cube, '_create') as create:
+                cached = cube(data)
+            create.assert_not_called()
+            pd.testing.assert_frame_equal(
+                cached.get_relation(RelationSchema(['Device'])),
+                first.get_relation(RelationSchema(['Device'])))
+
+            changed = cube(data.assign(Cost=[1, 2, 3]))
+            self.assertEqual(
+                changed.get_relation(RelationSchema([]))['Cost'].iloc[0], 6)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+    def test_eviction_keeps_unrelated_files(self):
+        """
+        Tests that evicting cached cubes never removes files the cube did
+        not write.
+        """
+        data = pd.DataFrame({'Device': ['Pixel', 'iPhone'], 'Cost': [1, 2]})
+        with tempfile.TemporaryDirectory() as cache_dir:
+            user_file = os.path.join(cache_dir, 'user_model.pkl')
+            pd.to_pickle({'weights': [1, 2]}, user_file)
+            cube = CreateRelationSpaceByCube(
+                grouping_keys=['Device'], aggregations={'Cost': 'sum'},
+                cache_dir=cache_dir, max_cached=1)
+            cube(data)
+            cube(data.assign(Cost=[3, 4]))
+
+            self.assertTrue(os.path.exists(user_file))
+            self.assertEqual(len(os.listdir(cache_dir)), 2)
+
+    def test_callable_aggregations_are_not_cached(self):
+        """
+        Tests that cubes with callable aggregations, which have no stable
+        cache key, are computed without being cached.
+        """
+        data = pd.DataFrame({'Device': ['Pixel', 'iPhone'], 'Cost': [1, 2]})
+        with tempfile.TemporaryDirectory() as cache_dir:
+            space = CreateRelationSpaceByCube(
+                grouping_keys=['Device'], aggregations={'Cost': np.sum},
+                cache_dir=cache_dir)(data)
+            self.assertEqual(
+                space.get_relation(RelationSchema([]))['Cost'].iloc[0], 3)
+            self.assertEqual(os.listdir(cache_dir), [])
+
+    def test_evicted_cache_file_is_recomputed(self):
+        """
+        Tests that a cache file removed by another process before it is read
+        makes the cube be recomputed.
+        """
+        data = pd.DataFrame({'Device': ['Pixel', 'iPhone'], 'Cost': [1, 2]})
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cube = CreateRelationSpaceByCube(
+                grouping_keys=['Device'], aggregations={'Cost': 'sum'},
+                cache_dir=cache_dir)
+            cube(data)
+            with mock.patch('pandas.read_pickle',
+                            side_effect=FileNotFoundError):
+                space = cube(data)
+            self.assertEqual(
+                space.get_relation(RelationSchema([]))['Cost'].iloc[0], 3)
+
+    def test_cache_key_includes_dtypes(self):
+        """
+        Tests that frames with equal values but different dtypes do not
+        share a cached cube.
+        """
+        data = pd.DataFrame({
+            'Device': pd.Series(['Pixel', 'iPhone', 'Pixel'], dtype=object),
+            'Cost': [100, 200, 50]
+        })
+        categorical = data.assign(Device=data['Device'].astype('category'))
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cube = CreateRelationSpaceByCube(
+                grouping_keys=['Device'], aggregations={'Cost': 'sum'},
+                cache_dir=cache_dir)
+            cube(data)
+            result = cube(categorical)
+            self.assertIsInstance(
+                result.get_relation(RelationSchema(['Device']))[
+                    'Device'].dtype, pd.CategoricalDtype)
+            self.assertEqual(len(os.listdir(cache_dir)), 2)
+
+    def test_unused_columns_are_ignored(self):
+        """
+        Tests that columns outside the grouping keys and aggregations affect
+        neither the cube nor its cache entry.
+        """
+        data = pd.DataFrame({
+            'Device': ['Pixel', 'iPhone', 'Pixel'],
+            'Cost': [100, 200, 50]
+        })
+        wide = data.assign(Date=['d1', 'd2', 'd3'])
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cube = CreateRelationSpaceByCube(
+                grouping_keys=['Device'], aggregations={'Cost': 'sum'},
+                cache_dir=cache_dir)
+            first = cube(data)
+            with mock.patch.object(cube, '_create') as create:
+                cached = cube(wide)
+            create.assert_not_called()
+            pd.testing.assert_frame_equal(
+                cached.get_relation(RelationSchema(['Device'])),
+                first.get_relation(RelationSchema(['Device'])))
+
+
+class RepresentTest(unittest.TestCase):
+    """
+    Test suite for the Represent operator.
+    """
+
+    def test_shared_region_partition(self):
+        """
+        Tests that feature schemas sharing a region schema each receive the
+        per-region feature tables of that region.
+        """
+        space = CreateRelationSpaceByCube(
+            grouping_keys=['Device', 'Browser'],
+            aggregations={'Cost': 'sum', 'Clicks': 'sum'}
+        )(pd.DataFrame({
+            'Device': ['Pixel', 'Pixel', 'iPhone'],
+            'Browser': ['Chrome', 'Safari', 'Safari'],
+            'Cost': [100, 200, 50],
+            'Clicks': [10, 20, 5]
+        }))
+
+        cost_schema = RelationSchema(['Cost'])
+        clicks_schema = RelationSchema(['Clicks'])
+        result = Represent(
+            region_schemas=[RelationSchema(['Device'])],
+            feature_schemas=[cost_schema, clicks_schema]
+        )(space)
+
+        pixel = create_relation_tuple({'Device': 'Pixel'})
+        iphone = create_relation_tuple({'Device': 'iPhone'})
+        self.assertEqual(set(result.data), {pixel, iphone})
+        self.assertEqual(result.data[pixel][cost_schema]['Cost'].tolist(),
+                         [300])
+        self.assertEqual(result.data[iphone][clicks_schema]['Clicks'].tolist(),
+                         [5])
+        self.assertEqual(list(result.data[pixel][cost_schema].index), [0])
+
+    def test_sorted_region_column_partition(self):
+        """
+        Tests that a relation already sorted on its single region column is
+        split into the same regions as an unsorted one.
+        """
+        dims = RelationSchema(['Device'])
+        cost_schema = RelationSchema(['Cost'])
+        represent = Represent(region_schemas=[dims],
+                              feature_schemas=[cost_schema])
+        data = pd.DataFrame({'Device': ['iPhone', 'Pixel', 'iPhone', 'Pixel'],
+                             'Cost': [1, 2, 3, 4]})
+
+        results = []
+        for relation in (data, data.sort_values('Device', kind='stable')):
+            space = RelationSpace(dimensions=dims)
+            space.add_relation(relation.reset_index(drop=True), dims)
+            results.append(represent(space))
+        unsorted_result, sorted_result = results
+
+        self.assertEqual(set(sorted_result.data), set(unsorted_result.data))
+        for region, features in unsorted_result.data.items():
+            pd.testing.assert_frame_equal(
+                sorted_result.data[region][cost_schema], features[cost_schema])
+
+    def test_fused_cube_matches_separate_operators(self):
+        """
+        Tests that a fusing pipeline of a cube and Represent, which runs as
+        a CubeAndRepresent, yields the same slice tuples as running the two
+        operators one after the other, while aggregating fewer grouping sets.
+        Pipelines do not fuse by default.
+        """
+        cube = CreateRelationSpaceByCube(
+            grouping_keys=['Device', 'Browser', 'Country'],
+            aggregations={'Cost': 'sum'})
+        represent = Represent(
+            region_schemas=[RelationSchema(['Device']),
+                            RelationSchema(['Browser'])],
+            feature_schemas=[RelationSchema(['Cost'])])
+        data = pd.DataFrame({
+            'Device': ['Pixel', 'Pixel', 'iPhone', 'iPhone'],
+            'Browser': ['Chrome', 'Safari', 'Safari', 'Edge'],
+            'Country': ['US', 'US', 'CA', 'CA'],
+            'Cost': [100, 200, 50, 150]
+        })
+
+        with mock.patch.object(cube, '_execute',
+                               wraps=cube._execute) as execute:
+            (cube | represent)(data)
+        execute.assert_called_once()
+
+        pipeline = Pipeline([cube, represent], fuse=True)
+        fused, = Pipeline._rewrite(pipeline.operators)
+        self.assertIsInstance(fused, CubeAndRepresent)
+        self.assertEqual(
+            fused.cube.grouping_sets,
+            {frozenset(['Device']), frozenset(['Browser'])})
+
+        expected = represent(cube(data))
+        result = pipeline(data)
+        self.assertEqual(list(result.data), list(expected.data))
+        for region, features in expected.data.items():
+            for schema, df in features.items():
+                pd.testing.assert_frame_equal(result.data[region][schema], df)
+
+    def test_pipeline_operators_are_fixed(self):
+        """
+        Tests that a pipeline's operators cannot be changed after it is
+        built, and that `|` composes a new pipeline instead.
+        """
+        cube = CreateRelationSpaceByCube(
+            grouping_keys=['Device'], aggregations={'Cost': 'sum'})
+        represent = Represent(
+            region_schemas=[RelationSchema(['Device'])],
+            feature_schemas=[RelationSchema(['Cost'])])
+        pipeline = Pipeline([cube])
+        with self.assertRaises(AttributeError):
+            pipeline.operators.append(represent)
+
+        extended = pipeline | represent
+        self.assertEqual(extended.operators, (cube, represent))
+        self.assertIsInstance(
+            extended(pd.DataFrame({'Device': ['Pixel'], 'Cost': [1]})),
+            SliceRelation)
+
+    def test_parallel_partitioning_matches_serial(self):
+        """
+        Tests that partitioning regions on a thread pool yields the same
+        slice tuples, in the same order, as partitioning serially.
+        """
+        space = CreateRelationSpaceByCube(
+            grouping_keys=['Device', 'Browser', 'Country'],
+            aggregations={'Cost': 'sum'}
+        )(pd.DataFrame({
+            'Device': ['Pixel', 'Pixel', 'iPhone', 'iPhone'],
+            'Browser': ['Chrome', 'Safari', 'Safari', 'Edge'],
+            'Country': ['US', 'US', 'CA', 'CA'],
+            'Cost': [100, 200, 50, 80]
+        }))
+        region_schemas = [RelationSchema(['Device']),
+                          RelationSchema(['Browser']),
+                          RelationSchema(['Country']),
+                          RelationSchema(['Device', 'Browser'])]
+        feature_schemas = [RelationSchema(['Cost'])]
+
+        serial = Represent(region_schemas, feature_schemas,
+                           max_workers=1)(space)
+        parallel = Represent(region_schemas, feature_schemas,
+                             max_workers=4)(space)
+
+        self.assertEqual(list(parallel.data), list(serial.data))
+        for region, features in serial.data.items():
+            for f_schema, feature_df in features.items():
+                pd.testing.assert_frame_equal(
+                    parallel.data[region][f_schema], feature_df)
 
 
 class SliceTransformTest(unittest.TestCase):
@@ -117,6 +497,354 @@ class SliceTransformTest(unittest.TestCase):
         self.assertIn(pixel_chrome, result.data)
         self.assertIn(pixel_safari, result.data)
 
+    def test_row_wise_transformation(self):
+        """
+        Tests that a row-wise transformation applied across all regions at
+        once yields the same per-region tables as applying it per region.
+        """
+        slice_relation = SliceRelation(dimensions=RelationSchema(['Device']))
+        ratio = RatioTransformation('Cost', 'Clicks', 'Cpc')
+        pixel = create_relation_tuple({'Device': 'Pixel'})
+        iphone = create_relation_tuple({'Device': 'iPhone'})
+        pixel_df = pd.DataFrame({'Clicks': [10, 0], 'Cost': [50, 0]})
+        iphone_df = pd.DataFrame({'Clicks': [4], 'Cost': [2]})
+        slice_relation.add_slice_tuple(pixel, ratio.feature_schema, pixel_df)
+        slice_relation.add_slice_tuple(iphone, ratio.feature_schema, iphone_df)
+
+        result = SliceTransform(
+            slice_transformations=[ratio],
+            dimensions=slice_relation.dimensions
+        )(slice_relation)
+
+        output_schema = RelationSchema(['Clicks', 'Cost', 'Cpc'])
+        pd.testing.assert_frame_equal(
+            result.data[pixel][output_schema], ratio(pixel_df))
+        pd.testing.assert_frame_equal(
+            result.data[iphone][output_schema], ratio(iphone_df))
+
+    def test_row_wise_transformation_keeps_dtypes(self):
+        """
+        Tests that batching a row-wise transformation over the stacked
+        feature tables yields the same dtypes as applying it per region.
+        """
+        class RowWiseCopyTransformation(CopyTransformation):
+            @property
+            def row_wise(self):
+                return True
+
+        schema = RelationSchema(['Country', 'Users'])
+        slice_relation = SliceRelation(dimensions=RelationSchema(['Device']))
+        for device in ('Pixel', 'iPhone'):
+            slice_relation.add_slice_tuple(
+                create_relation_tuple({'Device': device}), schema,
+                pd.DataFrame({
+                    'Country': pd.Categorical(['US', 'UK']),
+                    'Users': pd.array([1, None], dtype='Int64')}))
+
+        def transform(transformation):
+            return SliceTransform(
+                slice_transformations=[transformation],
+                dimensions=slice_relation.dimensions
+            )(slice_relation)
+
+        per_region = transform(CopyTransformation(schema))
+        batched = transform(RowWiseCopyTransformation(schema))
+
+        for region, features in per_region.data.items():
+            pd.testing.assert_frame_equal(
+                batched.data[region][schema], features[schema])
+
+    def test_parallel_transformation_matches_serial(self):
+        """
+        Tests that transforming regions on a thread pool yields the same
+        slice tuples, in the same order, as transforming serially.
+        """
+        slice_relation = SliceRelation(dimensions=RelationSchema(['Device']))
+        cost_schema = RelationSchema(['Cost'])
+        for i in range(SliceTransform.MIN_PARALLEL_REGIONS):
+            slice_relation.add_slice_tuple(
+                create_relation_tuple({'Device': f'Device{i}'}), cost_schema,
+                pd.DataFrame({'Cost': [i, i + 1]}))
+
+        def transform(max_workers):
+            return SliceTransform(
+                slice_transformations=[CopyTransformation(cost_schema)],
+                dimensions=slice_relation.dimensions,
+                max_workers=max_workers
+            )(slice_relation)
+
+        serial = transform(1)
+        parallel = transform(4)
+
+        self.assertEqual(list(parallel.data), list(serial.data))
+        for region, features in serial.data.items():
+            pd.testing.assert_frame_equal(
+                parallel.data[region][cost_schema], features[cost_schema])
+
+
+class SliceSelectTest(unittest.TestCase):
+    """
+    Test suite for the SliceSelect operator.
+    """
+
+    def test_feature_predicates(self):
+        """
+        Tests that a row-wise feature predicate keeps only the regions whose
+        rows all satisfy it, along with the reference region.
+        """
+        slice_relation = SliceRelation(dimensions=RelationSchema(['Device']))
+        cost_schema = RelationSchema(['Cost'])
+
+        reference = create_relation_tuple({})
+        pixel = create_relation_tuple({'Device': 'Pixel'})
+        iphone = create_relation_tuple({'Device': 'iPhone'})
+        surface = create_relation_tuple({'Device': 'Surface'})
+        slice_relation.add_slice_tuple(
+            reference, cost_schema, pd.DataFrame({'Cost': [10]}))
+        slice_relation.add_slice_tuple(
+            pixel, cost_schema, pd.DataFrame({'Cost': [100, 200]}))
+        slice_relation.add_slice_tuple(
+            iphone, cost_schema, pd.DataFrame({'Cost': [50, 300]}))
+        slice_relation.add_slice_tuple(
+            surface, RelationSchema(['Clicks']), pd.DataFrame({'Clicks': [1]}))
+
+        result = SliceSelect(
+            feature_predicates={cost_schema: lambda df: df['Cost'] > 60}
+        )(slice_relation)
+
+        self.assertEqual(set(result.data), {reference, pixel})
+
+    def test_region_predicates(self):
+        """
+        Tests that a region predicate selects regions on an aggregate of
+        their feature rows.
+        """
+        slice_relation = SliceRelation(dimensions=RelationSchema(['Device']))
+        cost_schema = RelationSchema(['Cost'])
+
+        pixel = create_relation_tuple({'Device': 'Pixel'})
+        iphone = create_relation_tuple({'Device': 'iPhone'})
+        surface = create_relation_tuple({'Device': 'Surface'})
+        slice_relation.add_slice_tuple(
+            pixel, cost_schema, pd.DataFrame({'Cost': [100, 200]}))
+        slice_relation.add_slice_tuple(
+            iphone, cost_schema, pd.DataFrame({'Cost': [50, 30]}))
+        slice_relation.add_slice_tuple(
+            surface, RelationSchema(['Clicks']), pd.DataFrame({'Clicks': [1]}))
+
+        result = SliceSelect(
+            region_predicates={
+                cost_schema: lambda regions: regions['Cost'].sum() > 100}
+        )(slice_relation)
+
+        self.assertEqual(set(result.data), {pixel})
+
+    def test_invalid_region_predicate_results_raise(self):
+        """
+        Tests that a region predicate must return a boolean Series indexed
+        by region id.
+        """
+        slice_relation = SliceRelation(dimensions=RelationSchema(['Device']))
+        cost_schema = RelationSchema(['Cost'])
+        slice_relation.add_slice_tuple(
+            create_relation_tuple({'Device': 'Pixel'}), cost_schema,
+            pd.DataFrame({'Cost': [100, 200]}))
+
+        invalid_predicates = [
+            (TypeError, lambda regions: True),
+            (TypeError, lambda regions: regions['Cost'].sum()),
+            (ValueError,
+             lambda regions: (regions['Cost'].sum() > 100).reset_index(
+                 drop=True)),
+        ]
+        for error, predicate in invalid_predicates:
+            with self.assertRaises(error):
+                SliceSelect(
+                    region_predicates={cost_schema: predicate}
+                )(slice_relation)
+
+    def test_selective_feature_predicates_run_first(self):
+        """
+        Tests that after a first call, the predicate that rejected the most
+        regions runs first, so later predicates can be skipped.
+        """
+        slice_relation = SliceRelation(dimensions=RelationSchema(['Device']))
+        cost_schema = RelationSchema(['Cost'])
+        clicks_schema = RelationSchema(['Clicks'])
+        for device in ['Pixel', 'iPhone']:
+            region = create_relation_tuple({'Device': device})
+            slice_relation.add_slice_tuple(
+                region, cost_schema, pd.DataFrame({'Cost': [100]}))
+            slice_relation.add_slice_tuple(
+                region, clicks_schema, pd.DataFrame({'Clicks': [5]}))
+
+        calls = []
+
+        def keep_all(df):
+            calls.append(len(df))
+            return df['Cost'] > 0
+
+        select = SliceSelect(feature_predicates={
+            cost_schema: keep_all,
+            clicks_schema: lambda df: df['Clicks'] > 10,
+        })
+
+        self.assertEqual(select(slice_relation).data, {})
+        self.assertEqual(select(slice_relation).data, {})
+        self.assertEqual(calls, [2])
+
+    def test_concurrent_calls_share_predicate_stats(self):
+        """
+        Tests that one SliceSelect called from several threads selects the
+        same regions and counts every evaluated region.
+        """
+        slice_relation = SliceRelation(dimensions=RelationSchema(['Device']))
+        cost_schema = RelationSchema(['Cost'])
+        for device, cost in [('Pixel', 100), ('iPhone', 5)]:
+            slice_relation.add_slice_tuple(
+                create_relation_tuple({'Device': device}), cost_schema,
+                pd.DataFrame({'Cost': [cost]}))
+        select = SliceSelect(
+            feature_predicates={cost_schema: lambda df: df['Cost'] > 10})
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(
+                lambda _: select(slice_relation), range(64)))
+
+        for result in results:
+            self.assertEqual(
+                set(result.data),
+                {create_relation_tuple({'Device': 'Pixel'})})
+        self.assertEqual(select._predicate_stats[cost_schema], [64, 128])
+
+
+class FlattenTest(unittest.TestCase):
+    """
+    Test suite for the Flatten operator.
+    """
+
+    def test_regions_with_same_schema_are_combined(self):
+        """
+        Tests that every region sharing a dimensional schema contributes its
+        rows to the single flattened relation for that schema.
+        """
+        dims = RelationSchema(['Device', 'Browser'])
+        slice_relation = SliceRelation(dimensions=dims)
+        cost_schema = RelationSchema(['Cost'])
+        clicks_schema = RelationSchema(['Clicks'])
+
+        pixel = create_relation_tuple({'Device': 'Pixel'})
+        iphone = create_relation_tuple({'Device': 'iPhone'})
+        slice_relation.add_slice_tuple(
+            pixel, cost_schema, pd.DataFrame({'Cost': [100, 200]}))
+        slice_relation.add_slice_tuple(
+            pixel, clicks_schema, pd.DataFrame({'Clicks': [1, 2]}))
+        slice_relation.add_slice_tuple(
+            iphone, cost_schema, pd.DataFrame({'Cost': [50]}))
+        slice_relation.add_slice_tuple(
+            iphone, clicks_schema, pd.DataFrame({'Clicks': [5]}))
+
+        result = Flatten(dimensions=dims)(slice_relation)
+
+        flat_df = result.get_relation(RelationSchema(['Device']))
+        self.assertEqual(list(flat_df.columns), ['Device', 'Cost', 'Clicks'])
+        self.assertEqual(flat_df['Device'].tolist(),
+                         ['Pixel'] * 4 + ['iPhone'])
+        self.assertEqual(flat_df['Cost'].tolist(), [100, 100, 200, 200, 50])
+        self.assertEqual(flat_df['Clicks'].tolist(), [1, 2, 1, 2, 5])
+
+    def test_cross_product_matches_chained_merges(self):
+        """
+        Tests that a region with several feature tables flattens to the
+        same rows, in the same order, as chaining cross merges.
+        """
+        dims = RelationSchema(['Device'])
+        slice_relation = SliceRelation(dimensions=dims)
+        tables = {
+            RelationSchema(['Cost']): pd.DataFrame({'Cost': [1, 2]}),
+            RelationSchema(['Clicks']): pd.DataFrame({'Clicks': [3, 4, 5]}),
+            RelationSchema(['Country', 'Users']): pd.DataFrame(
+                {'Country': ['US', 'UK'], 'Users': [6, 7]}),
+        }
+        pixel = create_relation_tuple({'Device': 'Pixel'})
+        for schema, df in tables.items():
+            slice_relation.add_slice_tuple(pixel, schema, df)
+
+        result = Flatten(dimensions=dims)(slice_relation)
+
+        expected = pd.DataFrame({'Device': ['Pixel']})
+        for df in tables.values():
+            expected = expected.merge(df, how='cross')
+        pd.testing.assert_frame_equal(
+            result.get_relation(RelationSchema(['Device'])), expected)
+
+    def test_extension_dtypes_are_preserved(self):
+        """
+        Tests that nullable integer and categorical feature columns keep
+        their dtypes, and missing values, through the cross product.
+        """
+        dims = RelationSchema(['Device'])
+        slice_relation = SliceRelation(dimensions=dims)
+        users_schema = RelationSchema(['Users'])
+        country_schema = RelationSchema(['Country'])
+        for device in ('Pixel', 'iPhone'):
+            region = create_relation_tuple({'Device': device})
+            slice_relation.add_slice_tuple(
+                region, users_schema,
+                pd.DataFrame({'Users': pd.array([1, None], dtype='Int64')}))
+            slice_relation.add_slice_tuple(
+                region, country_schema,
+                pd.DataFrame({'Country': pd.Categorical(['US', 'UK'])}))
+
+        flat_df = Flatten(dimensions=dims)(slice_relation).get_relation(dims)
+
+        self.assertEqual(flat_df['Users'].dtype, 'Int64')
+        self.assertEqual(flat_df['Users'].isna().tolist(),
+                         [False, False, True, True] * 2)
+        self.assertIsInstance(flat_df['Country'].dtype, pd.CategoricalDtype)
+        self.assertEqual(flat_df['Country'].tolist(), ['US', 'UK'] * 4)
+
+    def test_missing_feature_columns_are_padded_with_their_na(self):
+        """
+        Tests that a datetime feature column missing from some regions is
+        padded with NaT instead of failing to combine with NaN.
+        """
+        dims = RelationSchema(['Device'])
+        slice_relation = SliceRelation(dimensions=dims)
+        pixel = create_relation_tuple({'Device': 'Pixel'})
+        iphone = create_relation_tuple({'Device': 'iPhone'})
+        slice_relation.add_slice_tuple(
+            pixel, RelationSchema(['Date']),
+            pd.DataFrame({'Date': pd.to_datetime(['2025-01-01'])}))
+        slice_relation.add_slice_tuple(
+            iphone, RelationSchema(['Cost']), pd.DataFrame({'Cost': [50]}))
+
+        flat_df = Flatten(dimensions=dims)(slice_relation).get_relation(dims)
+
+        self.assertTrue(pd.api.types.is_datetime64_dtype(flat_df['Date']))
+        self.assertEqual(flat_df['Date'].isna().tolist(), [False, True])
+        self.assertEqual(flat_df['Cost'].isna().tolist(), [True, False])
+
+    def test_missing_region_values_stay_missing(self):
+        """
+        Tests that a missing region value is flattened to a missing value,
+        not to the string 'nan'.
+        """
+        dims = RelationSchema(['Device'])
+        slice_relation = SliceRelation(dimensions=dims)
+        cost_schema = RelationSchema(['Cost'])
+        slice_relation.add_slice_tuple(
+            create_relation_tuple({'Device': 'Pixel'}), cost_schema,
+            pd.DataFrame({'Cost': [100]}))
+        slice_relation.add_slice_tuple(
+            create_relation_tuple({'Device': np.nan}), cost_schema,
+            pd.DataFrame({'Cost': [50]}))
+
+        flat_df = Flatten(dimensions=dims)(slice_relation).get_relation(dims)
+
+        self.assertEqual(flat_df['Device'].isna().tolist(), [False, True])
+        self.assertEqual(flat_df['Device'].iloc[0], 'Pixel')
+
 
 class CrawlTest(unittest.TestCase):
     """
@@ -165,13 +893,103 @@ class CrawlTest(unittest.TestCase):
         # The final space should only contain the valid descendant
         # (Pixel, Chrome), not (Pixel, Safari).
         self.assertEqual(len(final_space._relations), 1)
-        final_region_schema = list(final_space._relations.keys())[0]
+        final_region_schema = next(iter(final_space._relations))
         self.assertEqual(final_region_schema.attributes,
                          ('Browser', 'Device'))
-        final_df = list(final_space._relations.values())[0]
+        final_df = final_space._relations[final_region_schema]
         self.assertEqual(final_df['Device'].iloc[0], 'Pixel')
         self.assertEqual(final_df['Browser'].iloc[0], 'Chrome')
 
+    def test_execution_matches_internal_pipeline(self):
+        """
+        Tests that Crawl's execution, which skips the projection step,
+        produces the same RelationSpace as its full internal pipeline.
+        """
+        base_relation = pd.DataFrame({
+            'Device': ['Pixel', 'Pixel', 'iPhone', 'Surface', 'iPhone'],
+            'Browser': ['Chrome', 'Firefox', 'Safari', 'Edge', 'Chrome'],
+            'Clicks': [100, 50, 200, 150, 300],
+            'Cost': [10, 8, 25, 22, 40]
+        })
+        space = CreateRelationSpaceByCube(
+            grouping_keys=['Device', 'Browser'],
+            aggregations={'Clicks': 'sum', 'Cost': 'sum'}
+        )(base_relation)
+
+        output_schema = RelationSchema(['Clicks', 'Cost', 'Cpc'])
+        crawl = Crawl(
+            region_schemas=[RelationSchema(['Device']),
+                            RelationSchema(['Browser']),
+                            RelationSchema(['Device', 'Browser'])],
+            slice_transformations=[RatioTransformation('Cost', 'Clicks', 'Cpc')],
+            predicate_func=lambda r, f: f[output_schema]['Cost'].sum() > 20,
+            dimensions=RelationSchema(['Device', 'Browser'])
+        )
+
+        fused = crawl(space)
+        pipelined = crawl.internal_pipeline(space)
+
+        self.assertEqual(list(fused._relations), list(pipelined._relations))
+        for schema, expected in pipelined._relations.items():
+            pd.testing.assert_frame_equal(fused.get_relation(schema), expected)
+
+    def test_region_predicates_match_predicate_func(self):
+        """
+        Tests that selecting regions with a vectorized region predicate
+        gives the same RelationSpace as the equivalent per-region predicate.
+        """
+        space = CreateRelationSpaceByCube(
+            grouping_keys=['Device', 'Browser'],
+            aggregations={'Clicks': 'sum', 'Cost': 'sum'}
+        )(pd.DataFrame({
+            'Device': ['Pixel', 'Pixel', 'iPhone', 'Surface', 'iPhone'],
+            'Browser': ['Chrome', 'Firefox', 'Safari', 'Edge', 'Chrome'],
+            'Clicks': [100, 50, 200, 150, 300],
+            'Cost': [10, 8, 25, 22, 40]
+        }))
+
+        output_schema = RelationSchema(['Clicks', 'Cost', 'Cpc'])
+        crawl_args = dict(
+            region_schemas=[RelationSchema(['Device']),
+                            RelationSchema(['Device', 'Browser'])],
+            slice_transformations=[RatioTransformation('Cost', 'Clicks', 'Cpc')],
+            dimensions=RelationSchema(['Device', 'Browser'])
+        )
+        per_region = Crawl(
+            predicate_func=lambda r, f: f[output_schema]['Cost'].sum() > 20,
+            **crawl_args)(space)
+        vectorized = Crawl(
+            predicate_func=None,
+            region_predicates={
+                output_schema: lambda regions: regions['Cost'].sum() > 20},
+            **crawl_args)(space)
+
+        self.assertEqual(list(vectorized._relations),
+                         list(per_region._relations))
+        for schema, expected in per_region._relations.items():
+            pd.testing.assert_frame_equal(
+                vectorized.get_relation(schema), expected)
+
+    def test_crawl_for_support(self):
+        """
+        Tests that the support of each region is its share of the total mass
+        of the reference region.
+        """
+        space = CreateRelationSpaceByCube(
+            grouping_keys=['Device'], aggregations={'Cost': 'sum'}
+        )(pd.DataFrame({'Device': ['Pixel', 'iPhone', 'Pixel'],
+                        'Cost': [100, 200, 100]}))
+
+        result = Crawl(
+            region_schemas=[RelationSchema(['Device'])],
+            slice_transformations=[SupportTransformation(mass_column='Cost')],
+            predicate_func=lambda r, f: True,
+            dimensions=RelationSchema(['Device'])
+        )(space)
+
+        relation = result.get_relation(RelationSchema(['Device']))
+        self.assertEqual(dict(zip(relation['Device'], relation['support'])),
+                         {'Pixel': 0.5, 'iPhone': 0.5})
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,10 +1,9 @@
 import pandas as pd
 import numpy as np
-from typing import Dict
 
 # Import the MRA operators and data structures
 from mra_operators import CreateRelationSpaceByCube, Crawl
-from mra_data import RelationSpace, SliceRelation, RelationSchema, RelationTuple
+from mra_data import RelationSpace, SliceRelation, RelationSchema
 from slice_transformations.ratio_transformation import RatioTransformation
 
 def run_crawl_example():
@@ -36,16 +35,14 @@ def run_crawl_example():
     )
 
     # Define a predicate to filter slices
-    # This will keep regions where the total cost is greater than 30
-    def total_cost_predicate(region: RelationTuple, features: Dict[RelationSchema, pd.DataFrame]) -> bool:
-        # The feature schema for the transformation's output will have all three columns
-        feature_schema_to_check = RelationSchema(['clicks', 'cost', 'cost_per_click'])
-        feature_df = features.get(feature_schema_to_check)
-
-        if feature_df is not None and not feature_df.empty:
-            total_cost = feature_df['cost'].sum()
-            return total_cost > 30
-        return False
+    # This will keep regions where the total cost is greater than 30. It is
+    # evaluated for all regions at once, over their feature tables grouped
+    # by region. The feature schema of the transformation's output has all
+    # three columns.
+    region_predicates = {
+        RelationSchema(['clicks', 'cost', 'cost_per_click']):
+            lambda regions: regions['cost'].sum() > 30
+    }
 
     # 3. Define the full pipeline by chaining the operators
     #    Stage 1: Create the initial RelationSpace using a cube.
@@ -63,8 +60,9 @@ def run_crawl_example():
                 RelationSchema(['device', 'browser'])
             ],
             slice_transformations=[cost_per_click_transformer],
-            predicate_func=total_cost_predicate,
-            dimensions=RelationSchema(['device', 'browser'])
+            predicate_func=None,
+            dimensions=RelationSchema(['device', 'browser']),
+            region_predicates=region_predicates
         )
     )
 
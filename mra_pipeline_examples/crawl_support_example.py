@@ -9,6 +9,9 @@ from mra_operators import CreateRelationSpaceByCube, Crawl
 # Import the transformation class
 from slice_transformations.support_transformation import SupportTransformation
 
+# Built once so the predicate does not rebuild the schema for every region.
+SUPPORT_SCHEMA = RelationSchema(['support'])
+
 def main():
     """
     Demonstrates an end-to-end pipeline using the CreateRelationSpace and 
@@ -33,9 +36,8 @@ def main():
 
     def high_support_predicate(region, features):
         """Predicate to select regions with support > 0.5"""
-        support_schema = RelationSchema(['support'])
-        if support_schema in features:
-            return features[support_schema]['support'].iloc[0] > 0.5
+        if SUPPORT_SCHEMA in features:
+            return features[SUPPORT_SCHEMA]['support'].iloc[0] > 0.5
         return False
 
     # 3. Define all the non-empty region schemas we want to analyze.
@@ -20,6 +20,9 @@ def run_flatten_example():
         ['iPhone',  'Chrome',   300,    40]
     ]
     sample_data = pd.DataFrame(data_rows, columns=['device', 'browser', 'clicks', 'cost'])
+    # Low-cardinality dimensions are grouped on integer category codes.
+    for col in ['device', 'browser']:
+        sample_data[col] = sample_data[col].astype('category')
     
     print("----------- Initial DataFrame -----------")
     print(sample_data.to_string(index=False))
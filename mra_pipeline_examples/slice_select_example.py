@@ -6,6 +6,9 @@ from typing import Dict
 from mra_operators import CreateRelationSpaceByCube, Represent, SliceSelect
 from mra_data import RelationSpace, SliceRelation, RelationSchema, RelationTuple
 
+# Built once so the predicate does not rebuild the schema for every region.
+CLICKS_COST_SCHEMA = RelationSchema(['clicks', 'cost'])
+
 def run_select_example():
     """
     Demonstrates a pipeline using the SliceSelect operator.
@@ -36,8 +39,7 @@ def run_select_example():
             return False
 
         # Condition (b): Check the feature table for total clicks
-        feature_schema_to_check = RelationSchema(['clicks', 'cost'])
-        feature_df = features.get(feature_schema_to_check)
+        feature_df = features.get(CLICKS_COST_SCHEMA)
 
         if feature_df is not None and not feature_df.empty:
             total_clicks = feature_df['clicks'].sum()
@@ -19,7 +19,8 @@ class SliceTransformation(ABC):
     def feature_schema(self) -> RelationSchema:
         """
         The schema of the DataFrame this transformation is designed to operate on.
-        This must be implemented by all subclasses.
+        This must be implemented by all subclasses, and must not change over the
+        lifetime of the instance, as operators look it up once per call.
         """
         pass
 
@@ -32,6 +33,17 @@ class SliceTransformation(ABC):
         """
         return False
 
+    @property
+    def row_wise(self) -> bool:
+        """
+        Specifies whether this transformation maps every input row to exactly
+        one output row, independently of the other rows, keeping the columns
+        it does not use. Such transformations are applied once to the feature
+        tables of all regions stacked together. Subclasses should override
+        this property to return True if this holds.
+        """
+        return False
+
     @property
     def reference_data(self) -> Optional[pd.DataFrame]:
         """The reference data available to the transformation."""
@@ -54,6 +66,10 @@ class SliceTransformation(ABC):
         """
         Executes the transformation's core logic on the given DataFrame.
 
+        The input table is shared with the SliceRelation it comes from and
+        must not be modified in place; build the result as a new DataFrame,
+        e.g. with `assign`, or copy the input first.
+
         Args:
             data: The input feature table (DataFrame).
 
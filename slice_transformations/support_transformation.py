@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+from typing import Optional
+
+# We assume mra_data.py and slice_transformations.py are accessible
+from mra_data import RelationSchema
+from slice_transformations.slice_transformation import SliceTransformation
+
+class SupportTransformation(SliceTransformation):
+    """
+    A transformation computing the support of a region: the share of the
+    total mass (e.g., cost) that falls into the region. The total is taken
+    from the reference data, i.e. the feature table of the empty region.
+    """
+    def __init__(self, mass_column: str, output_col: str = 'support'):
+        """
+        Initializes the transformation with its specific parameters.
+
+        Args:
+            mass_column: The name of the column holding the mass.
+            output_col: The name of the resulting support column.
+        """
+        super().__init__()
+        self.mass_column = mass_column
+        self.output_col = output_col
+        self._feature_schema = RelationSchema([mass_column])
+        self._total_mass: Optional[float] = None
+
+    @property
+    def feature_schema(self) -> RelationSchema:
+        """The required schema contains only the mass column."""
+        return self._feature_schema
+
+    @property
+    def require_reference_data(self) -> bool:
+        """The total mass comes from the reference data."""
+        return True
+
+    @SliceTransformation.reference_data.setter
+    def reference_data(self, data: Optional[pd.DataFrame]):
+        """
+        Sets the reference data and sums its mass once, instead of once per
+        region.
+        """
+        SliceTransformation.reference_data.fset(self, data)
+        self._total_mass = (None if data is None else
+                            float(data[self.mass_column].to_numpy().sum()))
+
+    def __call__(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Calculates the support of the region as a single-row table.
+        A zero total mass yields a support of 0.
+        """
+        if self._total_mass is None:
+            raise ValueError(
+                f"The transformation '{self.__class__.__name__}' requires "
+                "reference data, but none was provided.")
+        mass = data[self.mass_column].to_numpy().sum()
+        support = mass / self._total_mass if self._total_mass else 0.0
+        return pd.DataFrame({self.output_col: np.array([support],
+                                                       dtype=np.float64)})